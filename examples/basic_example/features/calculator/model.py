@@ -1,12 +1,34 @@
 """
 Calculator Model - Handles the calculator state and business logic
 """
+import functools
+import operator
 from typing import List
 from PySide6.QtGui import QIcon
 
 from opaque.models.annotations import IntField, BoolField, StringField, ListField, UIType
 from opaque.models.model import BaseModel
 from opaque.view.application import BaseApplication
+from .. import icons
+
+
+_OPS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "^": operator.pow,
+}
+
+# Operations where (a, b) and (b, a) give the same result, so the cache key
+# can be canonicalized to share entries between both operand orders.
+_COMMUTATIVE_OPERATIONS = frozenset({"+", "*"})
+
+
+@functools.lru_cache(maxsize=512)
+def _calculate_cached(a: float, b: float, operation: str) -> float:
+    """Memoized arithmetic for repeated (a, b, operation) combinations."""
+    return _OPS[operation](a, b)
 
 
 class CalculatorModel(BaseModel):
@@ -75,6 +97,10 @@ class CalculatorModel(BaseModel):
         self.pending_value = None
         self.current_value = "0"
         self.last_operation = ""
+        self.history = []
+        # Parsed form of current_value, tagged with the string it came from
+        self._current_numeric = 0.0
+        self._current_numeric_text = self.current_value
 
     # --- Model Interface --------------------------------
 
@@ -84,7 +110,7 @@ class CalculatorModel(BaseModel):
 
     def feature_icon(self) -> QIcon:
         """Override in subclasses to provide icon (can return str or QIcon)"""
-        return QIcon.fromTheme(self.FEATURE_ICON)
+        return icons.get(self.FEATURE_ICON)
 
     def feature_description(self) -> str:
         """Override in subclasses"""
@@ -104,6 +130,17 @@ class CalculatorModel(BaseModel):
         """Reset calculator to initial state."""
         self.current_value = "0"
         self.last_operation = ""
+        self._current_numeric = 0.0
+        self._current_numeric_text = self.current_value
+
+    def _current_number(self) -> float:
+        """Get current_value as a float, parsing it only when the text changed."""
+        # Identity check: any new display string (including ones restored
+        # from a workspace) invalidates the cached value
+        if self._current_numeric_text is not self.current_value:
+            self._current_numeric = float(self.current_value)
+            self._current_numeric_text = self.current_value
+        return self._current_numeric
 
     def clear(self):
         """Clear the calculator."""
@@ -137,7 +174,7 @@ class CalculatorModel(BaseModel):
             self.execute_operation()
 
         self.pending_operation = operation
-        self.pending_value = float(self.current_value)
+        self.pending_value = self._current_number()
         self.clear_on_next = True
         self.last_operation = operation
 
@@ -148,15 +185,14 @@ class CalculatorModel(BaseModel):
             return
 
         try:
-            current = float(self.current_value)
+            current = self._current_number()
             result = self._calculate(
                 self.pending_value, current, self.pending_operation)
 
             # Add to history
             history_entry = f"{self.pending_value} {self.pending_operation} {current} = {result}"
-            if not hasattr(self, 'history') or self.history is None:
-                self.history = []
             self.history.append(history_entry)
+            self.notify("history_appended", history_entry)
 
             # Update display
             if self.scientific_notation and abs(result) > 1e6:
@@ -175,28 +211,27 @@ class CalculatorModel(BaseModel):
 
     def _calculate(self, a: float, b: float, operation: str) -> float:
         """Perform the actual calculation."""
-        if operation == "+":
-            return a + b
-        elif operation == "-":
-            return a - b
-        elif operation == "*":
-            return a * b
-        elif operation == "/":
-            if b == 0:
-                raise ValueError("Division by zero")
-            return a / b
-        elif operation == "^":
-            return a ** b
-        else:
+        # Checked before the cache so the error path is never memoized
+        if operation == "/" and b == 0:
+            raise ValueError("Division by zero")
+        if operation not in _OPS:
             raise ValueError(f"Unknown operation: {operation}")
+        if operation in _COMMUTATIVE_OPERATIONS and b < a:
+            a, b = b, a
+        return _calculate_cached(a, b, operation)
 
     def toggle_sign(self):
         """Toggle the sign of the current value."""
         if self.current_value != "0":
+            cached = self._current_numeric_text is self.current_value
             if self.current_value.startswith("-"):
                 self.current_value = self.current_value[1:]
             else:
                 self.current_value = "-" + self.current_value
+            if cached:
+                # Negating the float keeps the cache valid without a re-parse
+                self._current_numeric = -self._current_numeric
+                self._current_numeric_text = self.current_value
             self.notify("current_value", self.current_value)
 
     def backspace(self):
@@ -212,7 +247,7 @@ class CalculatorModel(BaseModel):
 
     def get_history(self) -> List[str]:
         """Get calculation history."""
-        return self.history if hasattr(self, 'history') and self.history else []
+        return self.history
 
     def clear_history(self):
         """Clear calculation history."""
@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from opaque.view.application import BaseApplication
 
+from PySide6.QtCore import QTimer
+
 from opaque.presenters.presenter import BasePresenter
 from opaque.services.service import ServiceLocator
 
@@ -23,6 +25,9 @@ class CalculatorPresenter(BasePresenter):
         Initialize the calculator presenter.
         """
         super().__init__(model, view, app)
+        # Fields changed since the last view refresh; flushed once per event loop turn
+        self._dirty_fields = set()
+        self._flush_scheduled = False
 
     def bind_events(self):
         """Bind view events to presenter methods (required by BasePresenter)."""
@@ -35,9 +40,31 @@ class CalculatorPresenter(BasePresenter):
         self.view.toggle_sign_clicked.connect(self._on_toggle_sign_clicked)
         self.view.clear_history_clicked.connect(self._on_clear_history_clicked)
 
+        # Services resolved so far, so click handlers skip the locator lookup
+        self._services = {}
+        self._get_service("calculation")
+        self._get_service("logging")
+
+    def _get_service(self, name: str):
+        """Get a service, caching the reference once it has been registered."""
+        service = self._services.get(name)
+        if service is None:
+            service = ServiceLocator.get_service(name)
+            if service is not None:
+                self._services[name] = service
+        return service
+
     def update(self, field_name: str, new_value, old_value=None, model=None):
         """Handle model property changes (called by BaseModel)."""
-        self._update_view()
+        if field_name == "history_appended":
+            # Only the new entry needs to reach the view
+            self.view.append_history(new_value)
+            return
+
+        self._dirty_fields.add(field_name)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush)
 
         # Update status based on property
         if field_name == "state" and new_value == "cleared":
@@ -54,42 +81,60 @@ class CalculatorPresenter(BasePresenter):
         elif field_name == "error":
             self.view.set_status(f"Error: {new_value}")
             self.app.notification_presenter.notify_error("Calculator", f"Error: {new_value}")
-            self._log("error", f"Calculation error: {new_value}")
+            self._log("error", "Calculation error: %s", new_value)
 
     def _update_view(self):
         """Update view with current model state."""
         self.view.update_display(self.model.current_value)
-        self.view.update_history(self.model.get_history())
+        self._update_history()
 
         # Update theme color if it has changed
         if hasattr(self.model, 'theme_color'):
             self.view.set_theme_color(self.model.theme_color)
 
+    def _flush(self):
+        """Refresh only the widgets whose backing fields changed."""
+        dirty = self._dirty_fields
+        self._dirty_fields = set()
+        self._flush_scheduled = False
+
+        if "current_value" in dirty or "state" in dirty:
+            self.view.update_display(self.model.current_value)
+        if "theme_color" in dirty:
+            self.view.set_theme_color(self.model.theme_color)
+        # Appends reach the view through "history_appended"; only a
+        # replaced history list needs a full redraw
+        if "history" in dirty:
+            self._update_history()
+
+    def _update_history(self):
+        """Push the whole history to the view."""
+        self.view.update_history(self.model.get_history())
+
     def _on_digit_clicked(self, digit: str):
         """Handle digit button click."""
         self.model.append_digit(digit)
-        self._log("debug", f"Digit clicked: {digit}")
+        self._log("debug", "Digit clicked: %s", digit)
 
     def _on_operation_clicked(self, operation: str):
         """Handle operation button click."""
         self.model.set_operation(operation)
 
         # Use calculation service if available
-        calc_service = ServiceLocator.get_service("calculation")
+        calc_service = self._get_service("calculation")
         if calc_service:
             # Store in service history
-            calc_service._add_to_history(f"Operation: {operation}")
+            calc_service._add_to_history("Operation", operation)
 
     def _on_equals_clicked(self):
         """Handle equals button click."""
         self.model.execute_operation()
 
         # Use calculation service if available
-        calc_service = ServiceLocator.get_service("calculation")
+        calc_service = self._get_service("calculation")
         if calc_service and self.model.current_value != "Error":
             # Store result in service
-            calc_service._add_to_history(
-                f"Result: {self.model.current_value}")
+            calc_service._add_to_history("Result", self.model.current_value)
 
     def _on_clear_clicked(self):
         """Handle clear button click."""
@@ -112,11 +157,15 @@ class CalculatorPresenter(BasePresenter):
         self.model.clear_history()
         self._log("info", "History cleared")
 
-    def _log(self, level: str, message: str):
-        """Log a message using the logging service if available."""
-        logging_service = ServiceLocator.get_service("logging")
-        if logging_service:
-            logging_service.log(level, f"[Calculator] {message}")
+    def _log(self, level: str, message: str, *args):
+        """
+        Log a message using the logging service if available.
+        The args are passed through, so the message is only %-formatted by the
+        service that records it.
+        """
+        logging_service = self._get_service("logging")
+        if logging_service is not None:
+            logging_service.log(level, "[Calculator] " + message, *args)
 
     def on_view_show(self):
         """Show the calculator view."""
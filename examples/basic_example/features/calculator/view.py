@@ -1,7 +1,8 @@
 """
 Calculator View - Handles the UI for the calculator
 """
-from typing import List, Optional, Callable, Any
+from functools import partial
+from typing import List, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QPushButton,
@@ -13,6 +14,42 @@ from PySide6.QtGui import QFont, QIcon
 from opaque.view.view import BaseView
 from opaque.view.application import BaseApplication
 
+# (text, row, column, signal name, signal argument or None)
+_BUTTON_SPEC = (
+    ('C', 0, 0, 'clear_clicked', None),
+    ('CE', 0, 1, 'clear_entry_clicked', None),
+    ('←', 0, 2, 'backspace_clicked', None),
+    ('/', 0, 3, 'operation_clicked', '/'),
+
+    ('7', 1, 0, 'digit_clicked', '7'),
+    ('8', 1, 1, 'digit_clicked', '8'),
+    ('9', 1, 2, 'digit_clicked', '9'),
+    ('*', 1, 3, 'operation_clicked', '*'),
+
+    ('4', 2, 0, 'digit_clicked', '4'),
+    ('5', 2, 1, 'digit_clicked', '5'),
+    ('6', 2, 2, 'digit_clicked', '6'),
+    ('-', 2, 3, 'operation_clicked', '-'),
+
+    ('1', 3, 0, 'digit_clicked', '1'),
+    ('2', 3, 1, 'digit_clicked', '2'),
+    ('3', 3, 2, 'digit_clicked', '3'),
+    ('+', 3, 3, 'operation_clicked', '+'),
+
+    ('±', 4, 0, 'toggle_sign_clicked', None),
+    ('0', 4, 1, 'digit_clicked', '0'),
+    ('.', 4, 2, 'digit_clicked', '.'),
+    ('=', 4, 3, 'equals_clicked', None),
+)
+
+# Buttons drawn with the operator style
+_OPERATORS = frozenset(('+', '-', '*', '/', '='))
+
+
+def _emit(signal, argument, *_):
+    """Emit signal with a fixed argument, ignoring clicked()'s checked flag."""
+    signal.emit(argument)
+
 
 class CalculatorView(BaseView):
     """View for the calculator feature."""
@@ -52,42 +89,17 @@ class CalculatorView(BaseView):
         # Button grid
         button_layout = QGridLayout()
 
-        # Define buttons
-        buttons: list[tuple[str, int, int, Any]] = [
-            ('C', 0, 0, self.clear_clicked),
-            ('CE', 0, 1, self.clear_entry_clicked),
-            ('←', 0, 2, self.backspace_clicked),
-            ('/', 0, 3, lambda: self.operation_clicked.emit('/')),
-
-            ('7', 1, 0, lambda: self.digit_clicked.emit('7')),
-            ('8', 1, 1, lambda: self.digit_clicked.emit('8')),
-            ('9', 1, 2, lambda: self.digit_clicked.emit('9')),
-            ('*', 1, 3, lambda: self.operation_clicked.emit('*')),
-
-            ('4', 2, 0, lambda: self.digit_clicked.emit('4')),
-            ('5', 2, 1, lambda: self.digit_clicked.emit('5')),
-            ('6', 2, 2, lambda: self.digit_clicked.emit('6')),
-            ('-', 2, 3, lambda: self.operation_clicked.emit('-')),
-
-            ('1', 3, 0, lambda: self.digit_clicked.emit('1')),
-            ('2', 3, 1, lambda: self.digit_clicked.emit('2')),
-            ('3', 3, 2, lambda: self.digit_clicked.emit('3')),
-            ('+', 3, 3, lambda: self.operation_clicked.emit('+')),
-
-            ('±', 4, 0, self.toggle_sign_clicked),
-            ('0', 4, 1, lambda: self.digit_clicked.emit('0')),
-            ('.', 4, 2, lambda: self.digit_clicked.emit('.')),
-            ('=', 4, 3, self.equals_clicked),
-        ]
-
         # Create buttons
-        for text, row, col, callback in buttons:
+        for text, row, col, signal_name, argument in _BUTTON_SPEC:
+            signal = getattr(self, signal_name)
+            # Argument-less signals are chained directly, others emit their text
+            callback = signal if argument is None else partial(_emit, signal, argument)
             button = QPushButton(text)
             button.setMinimumSize(60, 60)
             button.clicked.connect(callback)
 
             # Style operator buttons differently
-            if text in ['+', '-', '*', '/', '=']:
+            if text in _OPERATORS:
                 button.setStyleSheet("""
                     QPushButton {
                         background-color: #4CAF50;
@@ -117,6 +129,8 @@ class CalculatorView(BaseView):
         self.history_display = QTextEdit()
         self.history_display.setReadOnly(True)
         self.history_display.setMaximumHeight(100)
+        # Keep only the last 10 entries when appending incrementally
+        self.history_display.document().setMaximumBlockCount(10)
         history_layout.addWidget(self.history_display)
 
         clear_history_btn = QPushButton("Clear History")
@@ -143,9 +157,17 @@ class CalculatorView(BaseView):
         # Check if history_display exists and is valid
         if hasattr(self, 'history_display') and self.history_display:
             try:
-                self.history_display.clear()
-                for entry in history[-10:]:  # Show last 10 entries
-                    self.history_display.append(entry)
+                # Show last 10 entries in one document rebuild
+                self.history_display.setPlainText("\n".join(history[-10:]))
+            except RuntimeError:
+                # Widget was deleted, skip update
+                pass
+
+    def append_history(self, entry: str):
+        """Append a single entry to the history display."""
+        if hasattr(self, 'history_display') and self.history_display:
+            try:
+                self.history_display.append(entry)
             except RuntimeError:
                 # Widget was deleted, skip update
                 pass
@@ -171,5 +193,5 @@ class CalculatorView(BaseView):
 
         # Update operator button styles
         for button in self.findChildren(QPushButton):
-            if button.text() in ['+', '-', '*', '/', '=']:
+            if button.text() in _OPERATORS:
                 button.setStyleSheet(operator_style)
@@ -0,0 +1,27 @@
+"""
+JSON helpers for the Data Viewer - uses orjson when installed, stdlib json otherwise
+"""
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+
+    loads = orjson.loads
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 encoded JSON."""
+        # Same output as orjson: compact separators unless indented, raw UTF-8
+        if indent:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        return text.encode("utf-8")
+
+    loads = json.loads
@@ -1,14 +1,40 @@
 """
 Data Viewer Model - Business logic and state management
 """
-import json
-from typing import List, Dict, Any
+from collections import Counter, namedtuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from PySide6.QtGui import QIcon
 from opaque.models.model import BaseModel
 from opaque.models.annotations import BoolField, IntField, StringField
 from opaque.view.application import BaseApplication
 
+from .. import icons
+from ._json import dumps, loads
+
+# Buffer size for data file I/O, large enough to hold typical exports whole
+_IO_BUFFER_SIZE = 1 << 20
+
+# Payload of the model's "data" notification. kind is one of:
+#   "reset"    - payload is the full data list
+#   "added"    - payload is (item, row)
+#   "removed"  - payload is (item_id, row)
+#   "sorted"   - payload is (column, order)
+DataEvent = namedtuple("DataEvent", "kind payload")
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Turn nested dicts/lists into tuples so filters can be compared cheaply.
+    Keys keep their order and scalars carry their type, so two filters only
+    compare equal when they serialize to the same JSON (True vs 1, 1 vs 1.0).
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (list, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
 
 class DataViewerModel(BaseModel):
     """Model for the data viewer feature."""
@@ -51,7 +77,18 @@ class DataViewerModel(BaseModel):
         """Initialize the model."""
         super().__init__(app)
         self.data = []
+        # Display order as indices into self.data; sorting permutes this
+        # instead of the data list itself
+        self._view_order: List[int] = []
+        # (column, reverse) the view order is currently sorted by, if any
+        self._sorted_by: Optional[Tuple[str, bool]] = None
+        # Per-column value lists built lazily from self.data, keyed by (column, default)
+        self._columns: Dict[Tuple[str, Any], List[Any]] = {}
+        self._stats_cache: Optional[Dict[str, Any]] = None
         self.filters = {}
+        # Frozen form and serialized text of the last filter passed to apply_filter
+        self._last_filter_key: Any = None
+        self._last_filter_text = ""
         self.selected_item = None
 
         # Initialize with sample data if auto_refresh is enabled
@@ -59,13 +96,21 @@ class DataViewerModel(BaseModel):
             self.generate_sample_data()
 
     def get_data(self) -> List[Dict[str, Any]]:
-        """Get the current data."""
+        """Get the current data in insertion order."""
         return self.data
 
+    def get_view_data(self) -> List[Dict[str, Any]]:
+        """Get the current data in display (sorted) order."""
+        data = self.data
+        return [data[i] for i in self._view_order]
+
     def set_data(self, data: List[Dict[str, Any]]):
         """Set the data and notify observers."""
         self.data = data
-        self.notify("data", data)
+        self._view_order = list(range(len(data)))
+        self._sorted_by = None
+        self._invalidate_caches()
+        self.notify("data", DataEvent("reset", data))
 
     def add_item(self, item: Dict[str, Any]):
         """Add an item to the data."""
@@ -75,33 +120,47 @@ class DataViewerModel(BaseModel):
             return
 
         self.data.append(item)
-        self.notify("data", self.data)
+        # New items are shown at the end, so the view is no longer sorted
+        self._view_order.append(len(self.data) - 1)
+        self._sorted_by = None
+        self._invalidate_caches()
+        self.notify("data", DataEvent("added", (item, len(self._view_order) - 1)))
 
     def remove_item(self, item_id: str):
         """Remove an item from the data."""
-        initial_length = len(self.data)
-        self.data = [item for item in self.data if item.get('id') != item_id]
-
-        if len(self.data) < initial_length:
-            self.notify("data", self.data)
-        else:
-            self.notify("error", f"Item with id {item_id} not found")
+        for index, item in enumerate(self.data):
+            if item.get('id') == item_id:
+                del self.data[index]
+                # Drop the item from the view order and shift later indices down
+                order = self._view_order
+                row = order.index(index)
+                self._view_order = [i - (i > index) for i in order if i != index]
+                self._invalidate_caches()
+                self.notify("data", DataEvent("removed", (item_id, row)))
+                return
+        self.notify("error", f"Item with id {item_id} not found")
 
     def clear_data(self):
         """Clear all data."""
         self.data = []
-        self.notify("data", self.data)
+        self._view_order = []
+        self._sorted_by = None
+        self._invalidate_caches()
+        self.notify("data", DataEvent("reset", self.data))
 
     def generate_sample_data(self):
         """Generate sample data for demonstration."""
+        # All sample items are created "now"; read the clock once
+        now_iso = datetime.now().isoformat()
+        categories = ('A', 'B', 'C')
         sample_data = []
         for i in range(10):
             sample_data.append({
                 'id': f'item_{i+1}',
                 'name': f'Sample Item {i+1}',
                 'value': (i + 1) * 100,
-                'category': ['A', 'B', 'C'][i % 3],
-                'created': datetime.now().isoformat(),
+                'category': categories[i % 3],
+                'created': now_iso,
                 'active': i % 2 == 0
             })
 
@@ -112,27 +171,37 @@ class DataViewerModel(BaseModel):
         self.filters = filter_dict
         # In a real implementation, this would filter the data
         # For now, just store the filters
-        self.last_filter = json.dumps(filter_dict)
+        key = _freeze(filter_dict)
+        if key != self._last_filter_key:
+            self._last_filter_key = key
+            self._last_filter_text = dumps(filter_dict).decode("utf-8")
+        self.last_filter = self._last_filter_text
         self.notify("filters", filter_dict)
 
     def sort_data(self, column: str, order: str = "asc"):
-        """Sort the data by the specified column."""
+        """Sort the displayed rows by the specified column."""
         self.sort_column = column
         self.sort_order = order
 
         try:
             reverse = (order == "desc")
-            self.data = sorted(self.data, key=lambda x: x.get(
-                column, ''), reverse=reverse)
-            self.notify("data", self.data)
+            if self._sorted_by == (column, not reverse):
+                # Same column, opposite direction: no comparisons needed
+                self._view_order.reverse()
+            elif self._sorted_by != (column, reverse):
+                key_column = self._sort_keys(column)
+                self._view_order = sorted(range(len(self.data)),
+                                          key=key_column.__getitem__, reverse=reverse)
+            self._sorted_by = (column, reverse)
+            self.notify("data", DataEvent("sorted", (column, order)))
         except Exception as e:
             self.notify("error", f"Failed to sort: {str(e)}")
 
     def export_data(self, file_path: str) -> bool:
         """Export data to a JSON file."""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            with open(file_path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(dumps(self.get_view_data(), indent=True))
             return True
         except Exception as e:
             self.notify("error", f"Export failed: {str(e)}")
@@ -141,8 +210,8 @@ class DataViewerModel(BaseModel):
     def import_data(self, file_path: str) -> bool:
         """Import data from a JSON file."""
         try:
-            with open(file_path, 'r') as f:
-                imported_data = json.load(f)
+            with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                imported_data = loads(f.read())
 
             if not isinstance(imported_data, list):
                 raise ValueError("Imported data must be a list")
@@ -153,8 +222,47 @@ class DataViewerModel(BaseModel):
             self.notify("error", f"Import failed: {str(e)}")
             return False
 
+    def _invalidate_caches(self):
+        """Drop everything derived from self.data after it changes."""
+        self._columns.clear()
+        self._stats_cache = None
+
+    def _column(self, column: str, default: Any = None) -> List[Any]:
+        """Get the values of one column across all items, cached until the data changes."""
+        key = (column, default)
+        values = self._columns.get(key)
+        if values is None:
+            values = [item.get(column, default) for item in self.data]
+            self._columns[key] = values
+        return values
+
+    def _sort_keys(self, column: str) -> List[Any]:
+        """Get the values to sort a column by, cached like _column()."""
+        if column != 'created':
+            return self._column(column, '')
+
+        # Compare timestamps as numbers rather than ISO strings; fall back to
+        # the strings if any value does not parse
+        key = ('created', datetime)
+        values = self._columns.get(key)
+        if values is None:
+            created = self._column(column, '')
+            try:
+                values = [datetime.fromisoformat(v).timestamp() if v else 0.0
+                          for v in created]
+            except (TypeError, ValueError):
+                values = created
+            self._columns[key] = values
+        return values
+
     def get_statistics(self) -> Dict[str, Any]:
-        """Get statistics about the current data."""
+        """
+        Get statistics about the current data, cached until the data changes.
+        Each call returns a copy, so callers cannot change the cached values.
+        """
+        if self._stats_cache is not None:
+            return self._copy_statistics(self._stats_cache)
+
         if not self.data:
             return {
                 'total_items': 0,
@@ -163,29 +271,24 @@ class DataViewerModel(BaseModel):
                 'total_value': 0
             }
 
-        categories = {}
-        active_count = 0
-        total_value = 0
-
-        for item in self.data:
-            # Count by category
-            category = item.get('category', 'Unknown')
-            categories[category] = categories.get(category, 0) + 1
+        total_items = len(self.data)
+        categories = Counter(self._column('category', 'Unknown'))
+        active_count = sum(map(bool, self._column('active', False)))
+        total_value = sum(self._column('value', 0))
 
-            # Count active items
-            if item.get('active', False):
-                active_count += 1
-
-            # Sum values
-            total_value += item.get('value', 0)
-
-        return {
-            'total_items': len(self.data),
-            'categories': categories,
+        self._stats_cache = {
+            'total_items': total_items,
+            'categories': dict(categories),
             'active_count': active_count,
             'total_value': total_value,
-            'average_value': total_value / len(self.data) if self.data else 0
+            'average_value': total_value / total_items
         }
+        return self._copy_statistics(self._stats_cache)
+
+    @staticmethod
+    def _copy_statistics(stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a statistics dict, including its nested categories."""
+        return {**stats, 'categories': dict(stats['categories'])}
 
     # --- Model Interface --------------------------------
 
@@ -195,7 +298,7 @@ class DataViewerModel(BaseModel):
 
     def feature_icon(self) -> QIcon:
         """Override in subclasses to provide icon (can return str or QIcon)"""
-        return QIcon.fromTheme(self.FEATURE_ICON)
+        return icons.get(self.FEATURE_ICON)
 
     def feature_description(self) -> str:
         """Override in subclasses"""
@@ -6,7 +6,7 @@ if TYPE_CHECKING:
     from opaque.view.application import BaseApplication
 from opaque.presenters.presenter import BasePresenter
 from opaque.services.service import ServiceLocator
-from .model import DataViewerModel
+from .model import DataEvent, DataViewerModel
 from .view import DataViewerView
 
 
@@ -32,19 +32,36 @@ class DataViewerPresenter(BasePresenter):
 
     def update(self, field_name: str, new_value, old_value=None, model=None):
         """Handle model property changes (called by BaseModel)."""
-        self._update_view()
-
-        # Update status based on property
+        # Only data changes touch the table; settings and sort fields need no repaint
         if field_name == "data":
-            self.view.set_status(f"Data updated: {len(new_value)} items")
-            self._log("info", f"Data updated with {len(new_value)} items")
+            self._on_data_event(new_value)
+        elif field_name == "filters":
+            self.view.update_filters(new_value)
         elif field_name == "error":
             self.view.set_status(f"Error: {new_value}")
             self._log("error", f"Data viewer error: {new_value}")
 
+    def _on_data_event(self, event: DataEvent):
+        """Apply a DataEvent from the model to the view."""
+        # Single-row changes patch the table instead of rebuilding it
+        if event.kind == "added":
+            self.view.insert_row(event.payload[0])
+        elif event.kind == "removed":
+            self.view.remove_item_row(event.payload[0])
+        elif event.kind == "sorted":
+            # Rewrite the existing rows in the model's typed sort order
+            self.view.reorder_rows(self.model.get_view_data())
+        else:
+            self._update_view()
+
+        count = len(self.model.get_data())
+        self.view.update_item_count(count)
+        self.view.set_status(f"Data updated: {count} items")
+        self._log("info", f"Data updated with {count} items")
+
     def _update_view(self):
         """Update view with current model state."""
-        data = self.model.get_data()
+        data = self.model.get_view_data()
         self.view.update_table(data)
         self.view.update_item_count(len(data))
 
@@ -56,7 +73,8 @@ class DataViewerPresenter(BasePresenter):
         """Handle refresh button click."""
         data_service = ServiceLocator.get_service("data")
         if data_service:
-            data = data_service.get_all_data()
+            # The model edits its data list in place, so build one from the tuple
+            data = list(data_service.get_all_data())
             self.model.set_data(data)
             self._log("info", "Data refreshed from service")
         else:
@@ -112,8 +130,12 @@ class DataViewerPresenter(BasePresenter):
                 self._log("info", f"Data imported from {import_path}")
                 data_service = ServiceLocator.get_service("data")
                 if data_service:
-                    for item in self.model.get_data():
-                        data_service.add_data(item['id'], item)
+                    items = self.model.get_data()
+                    if hasattr(data_service, "bulk_add"):
+                        data_service.bulk_add({item['id']: item for item in items})
+                    else:
+                        for item in items:
+                            data_service.add_data(item['id'], item)
             else:
                 self.view.set_status("Import failed")
                 self._log("error", "Data import failed")
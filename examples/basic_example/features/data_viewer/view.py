@@ -6,10 +6,19 @@ from PySide6.QtWidgets import (
     QTableWidgetItem, QLabel, QWidget, QFileDialog,
     QInputDialog, QMessageBox, QHeaderView
 )
-from PySide6.QtCore import Signal, QDateTime
+from PySide6.QtCore import Qt, Signal, QDateTime
 from opaque.view.view import BaseView
 from opaque.view.application import BaseApplication
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def _format_text(value: Any) -> str:
+    """Display text for a generic cell value."""
+    return "" if value is None else str(value)
+
+
+# bool is an int subclass, so False/True index straight into the labels
+_format_bool = ("No", "Yes").__getitem__
 
 
 class DataViewerView(BaseView):
@@ -26,6 +35,8 @@ class DataViewerView(BaseView):
     def __init__(self, app: BaseApplication, parent: Optional[QWidget] = None):
         """Initialize the view."""
         super().__init__(app, parent)
+        # (column index, key, formatter, default) per column of the current table
+        self._cell_specs: List[Tuple[int, str, Callable[[Any], str], Any]] = []
         self.init_ui()
 
     def feature_id(self) -> str:
@@ -42,29 +53,29 @@ class DataViewerView(BaseView):
         toolbar_layout = QHBoxLayout()
 
         self.refresh_btn = QPushButton("Refresh")
-        self.refresh_btn.clicked.connect(self.refresh_clicked.emit)
+        self.refresh_btn.clicked.connect(self.refresh_clicked)
         toolbar_layout.addWidget(self.refresh_btn)
 
         self.add_btn = QPushButton("Add Item")
-        self.add_btn.clicked.connect(self.add_clicked.emit)
+        self.add_btn.clicked.connect(self.add_clicked)
         toolbar_layout.addWidget(self.add_btn)
 
         self.remove_btn = QPushButton("Remove Item")
-        self.remove_btn.clicked.connect(self.remove_clicked.emit)
+        self.remove_btn.clicked.connect(self.remove_clicked)
         toolbar_layout.addWidget(self.remove_btn)
 
         self.clear_btn = QPushButton("Clear All")
-        self.clear_btn.clicked.connect(self.clear_clicked.emit)
+        self.clear_btn.clicked.connect(self.clear_clicked)
         toolbar_layout.addWidget(self.clear_btn)
 
         toolbar_layout.addStretch()
 
         self.import_btn = QPushButton("Import")
-        self.import_btn.clicked.connect(self.import_clicked.emit)
+        self.import_btn.clicked.connect(self.import_clicked)
         toolbar_layout.addWidget(self.import_btn)
 
         self.export_btn = QPushButton("Export")
-        self.export_btn.clicked.connect(self.export_clicked.emit)
+        self.export_btn.clicked.connect(self.export_clicked)
         toolbar_layout.addWidget(self.export_btn)
 
         layout.addLayout(toolbar_layout)
@@ -94,36 +105,98 @@ class DataViewerView(BaseView):
     def update_table(self, data: List[Dict[str, Any]]):
         """Update the table with data."""
         if not data:
+            self._cell_specs = []
             self.table.setRowCount(0)
             self.table.setColumnCount(0)
             return
 
-        # Set up columns
-        if data:
-            columns = list(data[0].keys())
-            self.table.setColumnCount(len(columns))
-            self.table.setHorizontalHeaderLabels(columns)
+        columns = list(data[0].keys())
+        table = self.table
+
+        # Populate with painting and signals suspended so Qt relayouts once
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        signals_blocked = table.blockSignals(True)
+        try:
+            table.setColumnCount(len(columns))
+            table.setHorizontalHeaderLabels(columns)
+            table.setRowCount(len(data))
+
+            # Pick a formatter per column once from the first row instead of
+            # type-checking every cell
+            first = data[0]
+            self._cell_specs = [
+                (col_idx, column, _format_bool, False)
+                if isinstance(first.get(column), bool)
+                else (col_idx, column, _format_text, None)
+                for col_idx, column in enumerate(columns)
+            ]
 
-            # Set row count
-            self.table.setRowCount(len(data))
+            for row_idx, item in enumerate(data):
+                self._fill_row(row_idx, item)
+        finally:
+            table.blockSignals(signals_blocked)
+            table.setUpdatesEnabled(True)
+
+        # Size columns to content once instead of on every item change
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        table.resizeColumnsToContents()
+
+    def insert_row(self, item: Dict[str, Any]):
+        """Append a single item as a new row."""
+        if not self._cell_specs:
+            self.update_table([item])
+            return
+
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self._fill_row(row, item)
+
+    def remove_item_row(self, item_id: str):
+        """Remove the row showing the given item, wherever sorting has put it."""
+        # Assuming first column is ID, as in get_selected_item_id
+        for cell in self.table.findItems(str(item_id), Qt.MatchFlag.MatchExactly):
+            if cell.column() == 0:
+                self.table.removeRow(cell.row())
+                break
+        if self.table.rowCount() == 0:
+            self.update_table([])
+
+    def reorder_rows(self, data: List[Dict[str, Any]]):
+        """
+        Show the same items in a new order, reusing the existing cells.
+
+        The order comes from the model so the table matches what it exports;
+        Qt's own sortItems would compare the display text instead.
+        """
+        if len(data) != self.table.rowCount() or not self._cell_specs:
+            self.update_table(data)
+            return
 
-            # Populate table
+        table = self.table
+        table.setUpdatesEnabled(False)
+        signals_blocked = table.blockSignals(True)
+        try:
             for row_idx, item in enumerate(data):
-                for col_idx, column in enumerate(columns):
-                    value = item.get(column, '')
-                    # Convert to string for display
-                    if isinstance(value, bool):
-                        value = "Yes" if value else "No"
-                    elif value is None:
-                        value = ""
-                    else:
-                        value = str(value)
-
-                    table_item = QTableWidgetItem(value)
-                    self.table.setItem(row_idx, col_idx, table_item)
-
-            # Resize columns to content
-            self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+                self._fill_row(row_idx, item)
+        finally:
+            table.blockSignals(signals_blocked)
+            table.setUpdatesEnabled(True)
+
+    def _fill_row(self, row: int, item: Dict[str, Any]):
+        """Write one item into a table row using the current column formatters."""
+        refresh_cell = self._refresh_cell
+        get = item.get
+        for col_idx, column, fmt, default in self._cell_specs:
+            refresh_cell(row, col_idx, fmt(get(column, default)))
+
+    def _refresh_cell(self, row: int, col: int, text: str):
+        """Set a cell's text, reusing its existing item when there is one."""
+        cell = self.table.item(row, col)
+        if cell is None:
+            self.table.setItem(row, col, QTableWidgetItem(text))
+        else:
+            cell.setText(text)
 
     def update_item_count(self, count: int):
         """Update the item count label."""
@@ -0,0 +1,28 @@
+"""
+Shared icon registry for the example features
+"""
+from typing import Dict
+
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QStyle
+
+_CACHE: Dict[str, QIcon] = {}
+_STANDARD_CACHE: Dict[QStyle.StandardPixmap, QIcon] = {}
+
+
+def get(name: str) -> QIcon:
+    """Get a theme icon by name, looking it up in the theme only once."""
+    icon = _CACHE.get(name)
+    if icon is None:
+        icon = QIcon.fromTheme(name)
+        _CACHE[name] = icon
+    return icon
+
+
+def standard(pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Get one of the application style's standard icons, created only once."""
+    icon = _STANDARD_CACHE.get(pixmap)
+    if icon is None:
+        icon = QApplication.style().standardIcon(pixmap)
+        _STANDARD_CACHE[pixmap] = icon
+    return icon
@@ -8,10 +8,13 @@
 # You should have received a copy of the MIT License along with this program.
 # If not, see <https://opensource.org/licenses/MIT>.
 """
+from collections import deque
+
 from PySide6.QtGui import QIcon
 from opaque.models.model import BaseModel
 from opaque.view.application import BaseApplication
 from opaque.models.annotations import BoolField, IntField, StringField
+from .. import icons
 
 
 class LoggingModel(BaseModel):
@@ -39,13 +42,16 @@ class LoggingModel(BaseModel):
 
     def __init__(self, app: BaseApplication):
         super().__init__(app)
-        self.log_messages = []
+        self.log_messages = deque(maxlen=self.max_lines)
 
     def add_log(self, message: str):
+        if self.log_messages.maxlen != self.max_lines:
+            # max_lines was changed in the settings, rebuild with the new bound
+            self.log_messages = deque(self.log_messages, maxlen=self.max_lines)
+        # A bounded deque drops the oldest message in O(1)
         self.log_messages.append(message)
-        if len(self.log_messages) > self.max_lines:
-            self.log_messages.pop(0)
-        self.notify("log_updated", self.log_messages)
+        # Observers only need the new line
+        self.notify("log_updated", message)
 
     # --- Model Interface --------------------------------
 
@@ -55,7 +61,7 @@ class LoggingModel(BaseModel):
 
     def feature_icon(self) -> QIcon:
         """Override in subclasses to provide icon (can return str or QIcon)"""
-        return QIcon.fromTheme(self.FEATURE_ICON)
+        return icons.get(self.FEATURE_ICON)
 
     def feature_description(self) -> str:
         """Override in subclasses"""
@@ -21,13 +21,16 @@ class LoggingPresenter(BasePresenter):
 
     def __init__(self, model: LoggingModel, view: LoggingView, app: 'BaseApplication'):
         super().__init__(model, view, app)
+        self.view.set_max_lines(self.model.max_lines)
 
     def bind_events(self):
         pass
 
     def update(self, field_name: str, new_value, old_value=None, model=None):
         if field_name == "log_updated":
-            self.view.update_log(new_value)
+            self.view.append_log(new_value)
+        elif field_name == "max_lines":
+            self.view.set_max_lines(new_value)
 
     def on_view_show(self):
         """Called when the view is shown."""
@@ -8,7 +8,6 @@
 # You should have received a copy of the MIT License along with this program.
 # If not, see <https://opensource.org/licenses/MIT>.
 """
-from typing import List
 from PySide6.QtWidgets import QTextEdit
 from opaque.view.view import BaseView
 from opaque.view.application import BaseApplication
@@ -27,7 +26,9 @@ class LoggingView(BaseView):
 
         self.log_view.append(self.tr("Logging window initialized."))
 
-    def update_log(self, messages: List[str]):
-        self.log_view.clear()
-        for message in messages:
-            self.log_view.append(message)
+    def append_log(self, message: str):
+        self.log_view.append(message)
+
+    def set_max_lines(self, max_lines: int):
+        # Qt drops the oldest blocks itself once the limit is reached
+        self.log_view.document().setMaximumBlockCount(max_lines)
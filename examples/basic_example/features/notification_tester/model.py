@@ -7,6 +7,7 @@ from PySide6.QtGui import QIcon
 from opaque.models.model import BaseModel
 from opaque.models.annotations import StringField
 from opaque.view.application import BaseApplication
+from .. import icons
 
 
 class NotificationTesterModel(BaseModel):
@@ -42,7 +43,7 @@ class NotificationTesterModel(BaseModel):
         return self.FEATURE_NAME
 
     def feature_icon(self) -> QIcon:
-        return QIcon.fromTheme(self.FEATURE_ICON)
+        return icons.get(self.FEATURE_ICON)
 
     def feature_description(self) -> str:
         return self.FEATURE_DESCRIPTION
@@ -12,6 +12,33 @@ from opaque.services.notification_service import NotificationLevel
 from .model import NotificationTesterModel
 from .view import NotificationTesterView
 
+# Notification/log source names
+_SOURCE = "NotificationTester"
+_DEMO_SOURCE = "Demo"
+
+# Level names offered by the view, mapped to their lower-case log names
+_LEVEL_NAMES = {
+    "DEBUG": "debug",
+    "INFO": "info",
+    "WARNING": "warning",
+    "ERROR": "error",
+    "CRITICAL": "critical",
+}
+_LEVELS = {name: getattr(NotificationLevel, name) for name in _LEVEL_NAMES}
+# Levels whose notifications stay until dismissed
+_PERSISTENT_LEVELS = frozenset({"ERROR", "CRITICAL"})
+# Levels whose log messages also raise a notification
+_NOTIFY_LEVELS = frozenset({"WARNING", "ERROR", "CRITICAL"})
+
+# Demo sequence as (notification presenter method, args, kwargs), one step per timer tick
+_DEMO_STEPS = (
+    ("notify_info", ("Demo Started", "Beginning notification system demonstration", _DEMO_SOURCE), {}),
+    ("log_info", ("Demo step 1: Info logging", _DEMO_SOURCE), {}),
+    ("notify_warning", ("Demo Warning", "This is a warning notification", _DEMO_SOURCE), {}),
+    ("log_error", ("Demo error log (this will create a notification)", _DEMO_SOURCE), {"notify": True}),
+    ("notify_info", ("Demo Complete", "Notification system demonstration finished", _DEMO_SOURCE), {}),
+)
+
 
 class NotificationTesterPresenter(BasePresenter):
     """Presenter for the notification tester feature."""
@@ -20,8 +47,15 @@ class NotificationTesterPresenter(BasePresenter):
 
     def __init__(self, model: NotificationTesterModel, view: NotificationTesterView, app: 'BaseApplication'):
         super().__init__(model, view, app)
-        self.demo_timer = None
+        # One timer for all demo runs, parented to the view
+        self.demo_timer = QTimer(self.view)
+        self.demo_timer.setInterval(2000)  # 2 second intervals
+        self.demo_timer.timeout.connect(self._demo_next_step)
         self.demo_step = 0
+        # Notification presenter log methods by level name, bound on first use
+        self._log_methods = None
+        # _DEMO_STEPS with the notification presenter methods bound, built on first run
+        self._demo_steps = None
 
     def bind_events(self):
         """Bind view events to presenter methods."""
@@ -46,8 +80,7 @@ class NotificationTesterPresenter(BasePresenter):
 
     def on_view_close(self):
         """Called when view is closed."""
-        if self.demo_timer:
-            self.demo_timer.stop()
+        self.demo_timer.stop()
 
     def _on_level_changed(self, level: str):
         self.model.selected_level = level
@@ -56,14 +89,14 @@ class NotificationTesterPresenter(BasePresenter):
         """Send a test notification"""
         try:
             level_text = self.model.selected_level
-            level = getattr(NotificationLevel, level_text)
+            level = _LEVELS[level_text]
             
             notification_id = self.app.notification_presenter.add_notification(
                 level=level,
                 title=f"Test {level_text} Notification",
-                message=f"This is a test {level_text.lower()} notification message.",
-                source="NotificationTester",
-                persistent=(level_text in ["ERROR", "CRITICAL"])
+                message=f"This is a test {_LEVEL_NAMES[level_text]} notification message.",
+                source=_SOURCE,
+                persistent=(level_text in _PERSISTENT_LEVELS)
             )
             
             self.model.status_message = f"Sent {level_text} notification (ID: {notification_id})"
@@ -74,13 +107,20 @@ class NotificationTesterPresenter(BasePresenter):
     def _on_send_log(self):
         """Send a test log message"""
         try:
-            level_text = self.model.selected_level.lower()
+            level = self.model.selected_level
+            level_text = _LEVEL_NAMES[level]
             message = f"Test {level_text} log message from NotificationTester"
             
             # Call the appropriate log method on notification presenter (which proxies to logger service/model)
             # NotificationPresenter has log_debug, log_info, etc.
-            log_method = getattr(self.app.notification_presenter, f"log_{level_text}")
-            log_method(message, "NotificationTester", notify=(level_text in ["warning", "error", "critical"]))
+            if self._log_methods is None:
+                presenter = self.app.notification_presenter
+                self._log_methods = {
+                    name: getattr(presenter, f"log_{lower}")
+                    for name, lower in _LEVEL_NAMES.items()
+                }
+            log_method = self._log_methods[level]
+            log_method(message, _SOURCE, notify=(level in _NOTIFY_LEVELS))
             
             self.model.status_message = f"Logged {level_text} message"
             
@@ -90,11 +130,16 @@ class NotificationTesterPresenter(BasePresenter):
     def _on_run_demo(self):
         """Run a demonstration sequence of notifications"""
         try:
-            # Create a timer to send notifications in sequence
-            self.demo_timer = QTimer()
+            if self._demo_steps is None:
+                presenter = self.app.notification_presenter
+                self._demo_steps = tuple(
+                    (getattr(presenter, name), args, kwargs)
+                    for name, args, kwargs in _DEMO_STEPS
+                )
+
+            # Restart the timer to send notifications in sequence
             self.demo_step = 0
-            self.demo_timer.timeout.connect(self._demo_next_step)
-            self.demo_timer.start(2000)  # 2 second intervals
+            self.demo_timer.start()
             
             self.model.status_message = "Running demo sequence..."
             
@@ -104,35 +149,16 @@ class NotificationTesterPresenter(BasePresenter):
     def _demo_next_step(self):
         """Execute the next step in the demo sequence"""
         try:
-            if self.demo_step == 0:
-                self.app.notification_presenter.notify_info(
-                    "Demo Started", "Beginning notification system demonstration", "Demo"
-                )
-            elif self.demo_step == 1:
-                self.app.notification_presenter.log_info(
-                    "Demo step 1: Info logging", "Demo"
-                )
-            elif self.demo_step == 2:
-                self.app.notification_presenter.notify_warning(
-                    "Demo Warning", "This is a warning notification", "Demo"
-                )
-            elif self.demo_step == 3:
-                self.app.notification_presenter.log_error(
-                    "Demo error log (this will create a notification)", "Demo", notify=True
-                )
-            elif self.demo_step == 4:
-                self.app.notification_presenter.notify_info(
-                    "Demo Complete", "Notification system demonstration finished", "Demo"
-                )
+            action, args, kwargs = self._demo_steps[self.demo_step]
+            action(*args, **kwargs)
+            self.demo_step += 1
+
+            if self.demo_step >= len(self._demo_steps):
                 self.demo_timer.stop()
                 self.model.status_message = "Demo sequence completed!"
-                return
-            
-            self.demo_step += 1
             
         except Exception as e:
-            if self.demo_timer:
-                self.demo_timer.stop()
+            self.demo_timer.stop()
             self.model.status_message = f"Demo error: {e}"
 
     def _on_toggle_panel(self):
@@ -152,6 +178,5 @@ class NotificationTesterPresenter(BasePresenter):
             self.model.status_message = f"Error clearing notifications: {e}"
 
     def cleanup(self):
-        if self.demo_timer:
-            self.demo_timer.stop()
+        self.demo_timer.stop()
         super().cleanup()
@@ -43,7 +43,7 @@ class NotificationTesterView(BaseView):
         self.level_combo = QComboBox()
         self.level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
         self.level_combo.setCurrentText("INFO")
-        self.level_combo.currentTextChanged.connect(self.level_changed.emit)
+        self.level_combo.currentTextChanged.connect(self.level_changed)
         layout.addWidget(self.level_combo)
         
         # Test buttons
@@ -68,7 +68,8 @@ class NotificationTesterView(BaseView):
         layout.addWidget(clear_notifications_btn)
         
         # Status
-        self.status_label = QLabel("Ready to test notifications...")
+        self._status_text = "Ready to test notifications..."
+        self.status_label = QLabel(self._status_text)
         self.status_label.setStyleSheet("margin-top: 20px; padding: 10px; background-color: palette(base); border: 1px solid palette(mid);")
         layout.addWidget(self.status_label)
         
@@ -79,7 +80,10 @@ class NotificationTesterView(BaseView):
         self.setWidget(container)
 
     def update_status(self, message: str):
-        """Update the status label"""
+        """Update the status label, skipping the relayout when the text is unchanged"""
+        if message == self._status_text:
+            return
+        self._status_text = message
         self.status_label.setText(message)
 
     def get_selected_level(self) -> str:
@@ -87,5 +91,9 @@ class NotificationTesterView(BaseView):
         return self.level_combo.currentText()
         
     def set_selected_level(self, level: str):
-        """Set selected level"""
+        """Set selected level without echoing it back through level_changed"""
+        if self.level_combo.currentText() == level:
+            return
+        blocked = self.level_combo.blockSignals(True)
         self.level_combo.setCurrentText(level)
+        self.level_combo.blockSignals(blocked)
@@ -1,18 +1,28 @@
 # This Python file uses the following encoding: utf-8
 from typing import Any
+from PySide6.QtCore import Qt
 from opaque.view.application import BaseApplication
 from opaque.presenters.presenter import BasePresenter
 from .model import TabManagerModel
 from .view import TabManagerView, TextWidget, CounterWidget, ListWidget
 
+# Notification/log source name
+_SOURCE = "TabManager"
+
 
 class TabManagerPresenter(BasePresenter):
     def __init__(self, model: TabManagerModel, view: TabManagerView, app: BaseApplication):
         super().__init__(model, view, app)
+        # (index, name) of the last tab switch that was logged
+        self._last_tab = None
         
-        # Connect signals
-        self.view.tab_widget.tabAdded.connect(self._on_tab_added)
-        self.view.tab_widget.tabRemoved.connect(self._on_tab_removed)
+        # Connect signals; add/remove logging is queued so a burst of tab
+        # changes (e.g. a workspace load) finishes before the log entries are
+        # dispatched. Those signals carry the tab name; currentTabChanged only
+        # has the index, so it stays direct to look the name up while valid.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.view.tab_widget.tabAdded.connect(self._on_tab_added, queued)
+        self.view.tab_widget.tabRemoved.connect(self._on_tab_removed, queued)
         self.view.tab_widget.currentTabChanged.connect(self._on_tab_changed)
 
     def bind_events(self) -> None:
@@ -23,7 +33,7 @@ class TabManagerPresenter(BasePresenter):
 
     def on_view_show(self) -> None:
         self.app.notification_presenter.notify_info(
-            "Tab Manager", "Feature active.", "TabManager"
+            "Tab Manager", "Feature active.", _SOURCE
         )
 
     def on_view_close(self) -> None:
@@ -32,27 +42,29 @@ class TabManagerPresenter(BasePresenter):
     # Public methods to add tabs
     def add_text_tab(self):
         self.view.tab_widget.add_tab("Text Editor", TextWidget())
-        self.app.notification_presenter.log_info("Added Text Tab", "TabManager")
+        self.app.notification_presenter.log_info("Added Text Tab", _SOURCE)
 
     def add_counter_tab(self):
         self.view.tab_widget.add_tab("Counter", CounterWidget())
-        self.app.notification_presenter.log_info("Added Counter Tab", "TabManager")
+        self.app.notification_presenter.log_info("Added Counter Tab", _SOURCE)
 
     def add_list_tab(self):
         self.view.tab_widget.add_tab("List", ListWidget())
-        self.app.notification_presenter.log_info("Added List Tab", "TabManager")
+        self.app.notification_presenter.log_info("Added List Tab", _SOURCE)
 
     # Signal handlers
     def _on_tab_added(self, index, name):
-        self.app.notification_presenter.log_debug(f"Tab added: {name} at {index}", "TabManager")
+        self.app.notification_presenter.log_debug(f"Tab added: {name} at {index}", _SOURCE)
 
     def _on_tab_removed(self, index, name):
-        self.app.notification_presenter.log_info(f"Tab closed: {name}", "TabManager")
+        self.app.notification_presenter.log_info(f"Tab closed: {name}", _SOURCE)
 
     def _on_tab_changed(self, index):
         name = self.view.tab_widget.get_tab_name(index)
-        if name:
-            self.app.notification_presenter.log_debug(f"Switched to tab: {name}", "TabManager")
+        # Qt repeats currentChanged for programmatic adds/removes; log each switch once
+        if name and (index, name) != self._last_tab:
+            self._last_tab = (index, name)
+            self.app.notification_presenter.log_debug(f"Switched to tab: {name}", _SOURCE)
 
     # Workspace Persistence
     def save_workspace(self, workspace_object: dict) -> None:
@@ -1,6 +1,6 @@
 # This Python file uses the following encoding: utf-8
 from typing import Optional
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QTextEdit, QSpinBox, QPushButton, QListWidget
@@ -9,6 +9,11 @@ from opaque.view.view import BaseView
 from opaque.view.application import BaseApplication
 from opaque.view.widgets import CloseableTabWidget
 
+# Workspace data keys for the tab widgets
+_TEXT_KEY = "text_content"
+_COUNTER_KEY = "counter_value"
+_LIST_KEY = "list_items"
+
 
 class TextWidget(QWidget):
     """A simple text editor widget for demonstration."""
@@ -23,11 +28,13 @@ class TextWidget(QWidget):
         layout.addWidget(self.text_edit)
 
     def get_workspace_data(self):
-        return {'text_content': self.text_edit.toPlainText()}
+        return {_TEXT_KEY: self.text_edit.toPlainText()}
 
     def load_workspace_data(self, data):
-        if 'text_content' in data:
-            self.text_edit.setPlainText(data['text_content'])
+        text = data.get(_TEXT_KEY)
+        # setPlainText rebuilds the whole document, skip it when unchanged
+        if text is not None and text != self.text_edit.toPlainText():
+            self.text_edit.setPlainText(text)
 
 
 class CounterWidget(QWidget):
@@ -46,22 +53,22 @@ class CounterWidget(QWidget):
         controls.addWidget(self.spin_box)
         
         btn_inc = QPushButton("+1")
-        btn_inc.clicked.connect(lambda: self.spin_box.setValue(self.spin_box.value() + 1))
+        btn_inc.clicked.connect(self.spin_box.stepUp)
         controls.addWidget(btn_inc)
         
         btn_dec = QPushButton("-1")
-        btn_dec.clicked.connect(lambda: self.spin_box.setValue(self.spin_box.value() - 1))
+        btn_dec.clicked.connect(self.spin_box.stepDown)
         controls.addWidget(btn_dec)
         
         layout.addLayout(controls)
         layout.addStretch()
 
     def get_workspace_data(self):
-        return {'counter_value': self.spin_box.value()}
+        return {_COUNTER_KEY: self.spin_box.value()}
 
     def load_workspace_data(self, data):
-        if 'counter_value' in data:
-            self.spin_box.setValue(data['counter_value'])
+        if _COUNTER_KEY in data:
+            self.spin_box.setValue(data[_COUNTER_KEY])
 
 
 class ListWidget(QWidget):
@@ -73,8 +80,14 @@ class ListWidget(QWidget):
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label)
         
+        # Python copy of the item texts, kept in step with the list widget
+        self._items = ["Item 1", "Item 2"]
+        # Set when _items changed while hidden; the list is refilled on show
+        self._list_stale = False
+        # Immutable copy of _items handed out on save, reset when it changes
+        self._ws_cache = None
         self.list_widget = QListWidget()
-        self.list_widget.addItems(["Item 1", "Item 2"])
+        self.list_widget.addItems(self._items)
         layout.addWidget(self.list_widget)
         
         controls = QHBoxLayout()
@@ -87,22 +100,55 @@ class ListWidget(QWidget):
         controls.addWidget(btn_del)
         layout.addLayout(controls)
 
+    @Slot()
     def _add_item(self):
-        self.list_widget.addItem(f"Item {self.list_widget.count() + 1}")
-
+        self._add_items_bulk([f"Item {len(self._items) + 1}"])
+
+    def _add_items_bulk(self, names):
+        """Append several items with a single repaint of the list."""
+        self._items.extend(names)
+        self._ws_cache = None
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.addItems(names)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+    @Slot()
     def _remove_item(self):
         row = self.list_widget.currentRow()
         if row >= 0:
+            del self._items[row]
+            self._ws_cache = None
             self.list_widget.takeItem(row)
 
     def get_workspace_data(self):
-        items = [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
-        return {'list_items': items}
+        if self._ws_cache is None:
+            self._ws_cache = tuple(self._items)
+        return {_LIST_KEY: self._ws_cache}
 
     def load_workspace_data(self, data):
-        if 'list_items' in data:
+        if _LIST_KEY in data:
+            self._items = list(data[_LIST_KEY])
+            self._ws_cache = None
+            if self.isVisible():
+                self._fill_list()
+            else:
+                self._list_stale = True
+
+    def showEvent(self, event):
+        if self._list_stale:
+            self._fill_list()
+        super().showEvent(event)
+
+    def _fill_list(self):
+        self._list_stale = False
+        self.list_widget.setUpdatesEnabled(False)
+        try:
             self.list_widget.clear()
-            self.list_widget.addItems(data['list_items'])
+            self.list_widget.addItems(self._items)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
 
 class TabManagerView(BaseView):
@@ -121,7 +167,8 @@ class TabManagerView(BaseView):
             widget_type=TextWidget,
             default_tab_name="Text Editor",
             minimum_tabs=0,
-            show_plus_tab=True
+            show_plus_tab=True,
+            lazy_tabs=True
         )
         layout.addWidget(self.tab_widget)
         
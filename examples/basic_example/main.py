@@ -4,10 +4,12 @@ This example demonstrates the new MVP (Model-View-Presenter) pattern
 along with the annotation system for settings and workspace persistence.
 It also shows how to configure custom paths for settings and workspace files.
 """
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication, QMessageBox
+import importlib
 import sys
+import traceback
 from pathlib import Path
 
 
@@ -16,6 +18,20 @@ from opaque.view.application import BaseApplication
 from opaque.models.configuration import DefaultApplicationConfiguration
 
 
+# (package, model class, view class, presenter class) for each example feature
+_FEATURES = (
+    ("features.calculator", "CalculatorModel", "CalculatorView", "CalculatorPresenter"),
+    ("features.data_viewer", "DataViewerModel", "DataViewerView", "DataViewerPresenter"),
+    ("features.logging", "LoggingModel", "LoggingView", "LoggingPresenter"),
+)
+# Features that are skipped, with a message, if they fail to import
+_OPTIONAL_FEATURES = (
+    ("features.tab_manager", "TabManagerModel", "TabManagerView", "TabManagerPresenter"),
+    ("features.notification_tester", "NotificationTesterModel",
+     "NotificationTesterView", "NotificationTesterPresenter"),
+)
+
+
 class MyApplicationConfiguration(DefaultApplicationConfiguration):
     # Define fields at class level
     application_name = StringField(default="MyExampleApplication")
@@ -61,7 +77,21 @@ class MyExampleApplication(BaseApplication):
     def __init__(self):
         self._configuration = MyApplicationConfiguration()
         super().__init__(self._configuration)
-        self.register_features()
+        # Import and build the features once the event loop is running, so
+        # the main window paints before any feature module is loaded
+        QTimer.singleShot(0, self._register_features_deferred)
+
+    def _register_features_deferred(self):
+        """Register the features and greet the user, after the window is up."""
+        # This runs from the event loop, outside __main__'s error handling:
+        # a required feature failing must still end the application
+        try:
+            self.register_features()
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            traceback.print_exc()
+            QApplication.exit(1)
+            return
         
         # Welcome notification
         self.notification_presenter.notify_info(
@@ -72,37 +102,8 @@ class MyExampleApplication(BaseApplication):
 
     def register_features(self):
         """Register MVP features and services."""
-
-        # Register calculator feature using the simplified approach
-        from features.calculator.model import CalculatorModel
-        from features.calculator.view import CalculatorView
-        from features.calculator.presenter import CalculatorPresenter
-        
-        # Create model and view with simplified constructors
-        calc_model = CalculatorModel(self)
-        calc_view = CalculatorView(self)
-        calc_presenter = CalculatorPresenter(calc_model, calc_view, self)
-        self.register_feature(calc_presenter)
-
-        # Register data viewer feature
-        from features.data_viewer.model import DataViewerModel
-        from features.data_viewer.view import DataViewerView
-        from features.data_viewer.presenter import DataViewerPresenter
-        
-        data_model = DataViewerModel(self)
-        data_view = DataViewerView(self)
-        data_presenter = DataViewerPresenter(data_model, data_view, self)
-        self.register_feature(data_presenter)
-
-        # Register logging feature
-        from features.logging.model import LoggingModel
-        from features.logging.view import LoggingView
-        from features.logging.presenter import LoggingPresenter
-        
-        log_model = LoggingModel(self)
-        log_view = LoggingView(self)
-        log_presenter = LoggingPresenter(log_model, log_view, self)
-        self.register_feature(log_presenter)
+        for spec in _FEATURES:
+            self._register_feature_package(*spec)
 
         # Register Console Feature
         try:
@@ -116,32 +117,21 @@ class MyExampleApplication(BaseApplication):
         except ImportError as e:
             print(f"Could not load Console feature: {e}")
 
-        # Register Tab Manager Feature
-        try:
-            from features.tab_manager.model import TabManagerModel
-            from features.tab_manager.view import TabManagerView
-            from features.tab_manager.presenter import TabManagerPresenter
-            
-            tab_model = TabManagerModel(self)
-            tab_view = TabManagerView(self)
-            tab_presenter = TabManagerPresenter(tab_model, tab_view, self)
-            self.register_feature(tab_presenter)
-        except ImportError as e:
-            print(f"Could not load Tab Manager feature: {e}")
+        for spec in _OPTIONAL_FEATURES:
+            try:
+                self._register_feature_package(*spec)
+            except Exception as e:
+                print(f"Could not load feature {spec[0]}: {e}")
 
-        # Register Notification Tester Feature
-        try:
-            from features.notification_tester.model import NotificationTesterModel
-            from features.notification_tester.view import NotificationTesterView
-            from features.notification_tester.presenter import NotificationTesterPresenter
-            
-            notif_model = NotificationTesterModel(self)
-            notif_view = NotificationTesterView(self)
-            notif_presenter = NotificationTesterPresenter(notif_model, notif_view, self)
-            self.register_feature(notif_presenter)
-        except ImportError as e:
-            print(f"Could not load Notification Tester feature: {e}")
+    def _register_feature_package(self, package: str, model_name: str,
+                                  view_name: str, presenter_name: str):
+        """Import a feature's model/view/presenter modules and register it."""
+        model_class = getattr(importlib.import_module(f"{package}.model"), model_name)
+        view_class = getattr(importlib.import_module(f"{package}.view"), view_name)
+        presenter_class = getattr(importlib.import_module(f"{package}.presenter"), presenter_name)
 
+        presenter = presenter_class(model_class(self), view_class(self), self)
+        self.register_feature(presenter)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -155,6 +145,5 @@ if __name__ == "__main__":
         sys.exit(app.exec())
     except Exception as e:
         print(f"An error occurred: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -1,11 +1,24 @@
 """
 Example Calculation Service
 """
-import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'src'))
+from collections import deque
 
-from opaque.core.services import BaseService
+from opaque.services.service import BaseService
+
+# Number of history entries kept
+_HISTORY_SIZE = 100
+
+# Display format for each history entry, keyed by its operation code
+_HISTORY_FORMATS = {
+    "+": "{a} + {b} = {result}",
+    "-": "{a} - {b} = {result}",
+    "*": "{a} * {b} = {result}",
+    "/": "{a} / {b} = {result}",
+    "MS": "M = {a}",
+    "MC": "MC = {a}",
+    "Operation": "Operation: {a}",
+    "Result": "Result: {a}",
+}
 
 
 class CalculationService(BaseService):
@@ -13,42 +26,33 @@ class CalculationService(BaseService):
 
     def __init__(self):
         super().__init__("CalculationService")
-        self._history: list[str] = []
+        # Raw (op, a, b, result) records; formatted only when history is read
+        self._history: deque[tuple] = deque(maxlen=_HISTORY_SIZE)
         self._memory: float | None = None
+        # Rendered history, shared between get_history calls until it changes
+        self._history_text: tuple[str, ...] | None = None
 
-    def _add_to_history(self, entry: str) -> None:
-        """Add an entry to history."""
-        self._history.append(entry)
-        # Keep only last 100 entries
-        if len(self._history) > 100:
-            self._history.pop(0)
-
-    # no special need for initialization
-    def initialize(self):
-        """Initialize the calculation service."""
-        super().initialize()
-
-    # no special need for cleanup
-    def cleanup(self):
-        """Cleanup calculation service"""
-        super().cleanup()
+    def _add_to_history(self, op: str, a, b=None, result=None) -> None:
+        """Add an entry to history, dropping the oldest past _HISTORY_SIZE."""
+        self._history.append((op, a, b, result))
+        self._history_text = None
 
     def add(self, a: float, b: float) -> float:
         """Add two numbers."""
         result = a + b
-        self._add_to_history(f"{a} + {b} = {result}")
+        self._add_to_history("+", a, b, result)
         return result
 
     def subtract(self, a: float, b: float) -> float:
         """Subtract b from a."""
         result = a - b
-        self._add_to_history(f"{a} - {b} = {result}")
+        self._add_to_history("-", a, b, result)
         return result
 
     def multiply(self, a: float, b: float) -> float:
         """Multiply two numbers."""
         result = a * b
-        self._add_to_history(f"{a} * {b} = {result}")
+        self._add_to_history("*", a, b, result)
         return result
 
     def divide(self, a: float, b: float) -> float:
@@ -56,31 +60,37 @@ class CalculationService(BaseService):
         if b == 0:
             raise ValueError("Cannot divide by zero")
         result = a / b
-        self._add_to_history(f"{a} / {b} = {result}")
+        self._add_to_history("/", a, b, result)
         return result
 
     def memory_store(self, a: float) -> float:
         """Store number a in memory"""
         self._memory = a
-        self._add_to_history(f"M = {a}")
+        self._add_to_history("MS", a)
         return a
 
     def memory_add(self, a: float) -> float:
         """Add the number a to the number stored in memory"""
-        if self._memory:
-            return self.add(self._memory, a)
-        return 0
+        memory = self._memory
+        if memory is not None:
+            return self.add(memory, a)
+        return 0.0
 
     def memory_clear(self) -> None:
         """Clear the memory"""
-        self._add_to_history(f"MC = {self._memory}")
+        self._add_to_history("MC", self._memory)
         self._memory = None
         return self._memory
 
-    def get_history(self) -> list[str]:
+    def get_history(self) -> tuple[str, ...]:
         """Get calculation history."""
-        return self._history.copy()
+        if self._history_text is None:
+            self._history_text = tuple(
+                _HISTORY_FORMATS[op].format(a=a, b=b, result=result)
+                for op, a, b, result in self._history)
+        return self._history_text
 
     def clear_history(self) -> None:
         """Clear calculation history."""
         self._history.clear()
+        self._history_text = None
@@ -1,8 +1,11 @@
 """
 Example Data Service
 """
-from typing import Dict, Any, List
-from opaque.core.services import BaseService
+from typing import Dict, Any, Tuple
+from opaque.services.service import BaseService
+
+# Sentinel for dict lookups where None is a valid stored value
+_MISSING = object()
 
 
 class DataService(BaseService):
@@ -11,6 +14,8 @@ class DataService(BaseService):
     def __init__(self):
         super().__init__("DataService")
         self._data_store = {}
+        # Tuple of the stored values, rebuilt on the first read after a change
+        self._values_cache = None
     
     def initialize(self, **kwargs):
         """Initialize the data service."""
@@ -26,6 +31,17 @@ class DataService(BaseService):
             data: Data to store
         """
         self._data_store[key] = data
+        self._values_cache = None
+    
+    def bulk_add(self, items: Dict[str, Any]) -> None:
+        """
+        Add several entries to the store at once.
+        
+        Args:
+            items: Mapping of unique identifier to data
+        """
+        self._data_store.update(items)
+        self._values_cache = None
     
     def get_data(self, key: str) -> Any:
         """
@@ -49,23 +65,29 @@ class DataService(BaseService):
         Returns:
             True if removed, False if not found
         """
-        if key in self._data_store:
-            del self._data_store[key]
-            return True
-        return False
+        if self._data_store.pop(key, _MISSING) is _MISSING:
+            return False
+        self._values_cache = None
+        return True
     
-    def get_all_data(self) -> List[Dict[str, Any]]:
+    def get_all_data(self) -> Tuple[Dict[str, Any], ...]:
         """
-        Get all stored data as a list.
+        Get all stored data.
+        
+        The tuple is shared between calls until the store changes; it is
+        immutable so callers cannot change the store through it.
         
         Returns:
-            List of all stored data items
+            Tuple of all stored data items
         """
-        return list(self._data_store.values())
+        if self._values_cache is None:
+            self._values_cache = tuple(self._data_store.values())
+        return self._values_cache
     
     def clear_data(self) -> None:
         """Clear all stored data."""
         self._data_store.clear()
+        self._values_cache = None
     
     def data_exists(self, key: str) -> bool:
         """
@@ -87,7 +109,7 @@ class DataService(BaseService):
         """Get service information."""
         info = super().get_info()
         info['data_count'] = self.get_data_count()
-        info['keys'] = list(self._data_store.keys())
+        info['keys'] = tuple(self._data_store)
         return info
 
     def cleanup(self):
@@ -1,7 +1,7 @@
 """
 Example Logging Service
 """
-from opaque.core.services import BaseService
+from opaque.services.service import BaseService
 from datetime import datetime
 
 
@@ -17,14 +17,17 @@ class LoggingService(BaseService):
         super().initialize(**kwargs)
         self.log("info", "Logging service initialized")
 
-    def log(self, level: str, message: str) -> None:
+    def log(self, level: str, message: str, *args) -> None:
         """
         Log a message with a given level.
 
         Args:
             level: Log level (info, warning, error, debug)
-            message: Message to log
+            message: Message to log, %-formatted with args if any are given
+            args: Values for the message's % placeholders
         """
+        if args:
+            message = message % args
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = {
             'timestamp': timestamp,
@@ -14,20 +14,16 @@ It shows:
 """
 
 import sys
-from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
 from PySide6.QtGui import QAction, QIcon
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtWidgets import (
     QApplication, QVBoxLayout, QHBoxLayout,
     QWidget, QPushButton, QLabel, QTextEdit, QSpinBox,
-    QListWidget, QFileDialog, QMessageBox, QStyle
+    QListWidget, QStyle
 )
 
-# Add the src directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
 from opaque.view.application import BaseApplication
 from opaque.models.configuration import DefaultApplicationConfiguration
 from opaque.models.model import BaseModel
@@ -55,8 +51,10 @@ class TextWidget(QWidget):
         return {'text_content': self.text_edit.toPlainText()}
 
     def load_workspace_data(self, data):
-        if 'text_content' in data:
-            self.text_edit.setPlainText(data['text_content'])
+        text = data.get('text_content')
+        # setPlainText rebuilds the whole document, skip it when unchanged
+        if text is not None and text != self.text_edit.toPlainText():
+            self.text_edit.setPlainText(text)
 
 
 class CounterWidget(QWidget):
@@ -75,11 +73,11 @@ class CounterWidget(QWidget):
         controls.addWidget(self.spin_box)
         
         btn_inc = QPushButton("+1")
-        btn_inc.clicked.connect(lambda: self.spin_box.setValue(self.spin_box.value() + 1))
+        btn_inc.clicked.connect(self.spin_box.stepUp)
         controls.addWidget(btn_inc)
         
         btn_dec = QPushButton("-1")
-        btn_dec.clicked.connect(lambda: self.spin_box.setValue(self.spin_box.value() - 1))
+        btn_dec.clicked.connect(self.spin_box.stepDown)
         controls.addWidget(btn_dec)
         
         layout.addLayout(controls)
@@ -102,8 +100,14 @@ class ListWidget(QWidget):
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label)
         
+        # Python copy of the item texts, kept in step with the list widget
+        self._items = ["Item 1", "Item 2"]
+        # Set when _items changed while hidden; the list is refilled on show
+        self._list_stale = False
+        # Immutable copy of _items handed out on save, reset when it changes
+        self._ws_cache = None
         self.list_widget = QListWidget()
-        self.list_widget.addItems(["Item 1", "Item 2"])
+        self.list_widget.addItems(self._items)
         layout.addWidget(self.list_widget)
         
         controls = QHBoxLayout()
@@ -116,32 +120,71 @@ class ListWidget(QWidget):
         controls.addWidget(btn_del)
         layout.addLayout(controls)
 
+    @Slot()
     def _add_item(self):
-        self.list_widget.addItem(f"Item {self.list_widget.count() + 1}")
-
+        self._add_items_bulk([f"Item {len(self._items) + 1}"])
+
+    def _add_items_bulk(self, names):
+        """Append several items with a single repaint of the list."""
+        self._items.extend(names)
+        self._ws_cache = None
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.addItems(names)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
+
+    @Slot()
     def _remove_item(self):
         row = self.list_widget.currentRow()
         if row >= 0:
+            del self._items[row]
+            self._ws_cache = None
             self.list_widget.takeItem(row)
 
     def get_workspace_data(self):
-        items = [self.list_widget.item(i).text() for i in range(self.list_widget.count())]
-        return {'list_items': items}
+        if self._ws_cache is None:
+            self._ws_cache = tuple(self._items)
+        return {'list_items': self._ws_cache}
 
     def load_workspace_data(self, data):
         if 'list_items' in data:
+            self._items = list(data['list_items'])
+            self._ws_cache = None
+            if self.isVisible():
+                self._fill_list()
+            else:
+                self._list_stale = True
+
+    def showEvent(self, event):
+        if self._list_stale:
+            self._fill_list()
+        super().showEvent(event)
+
+    def _fill_list(self):
+        self._list_stale = False
+        self.list_widget.setUpdatesEnabled(False)
+        try:
             self.list_widget.clear()
-            self.list_widget.addItems(data['list_items'])
+            self.list_widget.addItems(self._items)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
 
 # --- MVP Components ---
 
 class TabExampleModel(BaseModel):
+    # Style icon shared by all instances, created on first use
+    _icon: Optional[QIcon] = None
+
     def feature_name(self) -> str:
         return "Tab Manager"
 
     def feature_icon(self) -> QIcon:
-        return QApplication.style().standardIcon(QStyle.StandardPixmap.SP_DirIcon)
+        if TabExampleModel._icon is None:
+            TabExampleModel._icon = QApplication.style().standardIcon(
+                QStyle.StandardPixmap.SP_DirIcon)
+        return TabExampleModel._icon
 
     def feature_description(self) -> str:
         return "Demonstrates CloseableTabWidget"
@@ -163,7 +206,8 @@ class TabExampleView(BaseView):
             widget_type=TextWidget,
             default_tab_name="Text Editor",
             minimum_tabs=0,
-            show_plus_tab=True
+            show_plus_tab=True,
+            lazy_tabs=True
         )
         layout.addWidget(self.tab_widget)
         
@@ -174,10 +218,16 @@ class TabExampleView(BaseView):
 class TabExamplePresenter(BasePresenter):
     def __init__(self, model: TabExampleModel, view: TabExampleView, app: BaseApplication):
         super().__init__(model, view, app)
+        # (index, name) of the last tab switch that was logged
+        self._last_tab = None
         
-        # Connect signals
-        self.view.tab_widget.tabAdded.connect(self._on_tab_added)
-        self.view.tab_widget.tabRemoved.connect(self._on_tab_removed)
+        # Connect signals; add/remove logging is queued so a burst of tab
+        # changes (e.g. a workspace load) finishes before the log entries are
+        # dispatched. Those signals carry the tab name; currentTabChanged only
+        # has the index, so it stays direct to look the name up while valid.
+        queued = Qt.ConnectionType.QueuedConnection
+        self.view.tab_widget.tabAdded.connect(self._on_tab_added, queued)
+        self.view.tab_widget.tabRemoved.connect(self._on_tab_removed, queued)
         self.view.tab_widget.currentTabChanged.connect(self._on_tab_changed)
 
     def bind_events(self) -> None:
@@ -220,7 +270,9 @@ class TabExamplePresenter(BasePresenter):
 
     def _on_tab_changed(self, index):
         name = self.view.tab_widget.get_tab_name(index)
-        if name:
+        # Qt repeats currentChanged for programmatic adds/removes; log each switch once
+        if name and (index, name) != self._last_tab:
+            self._last_tab = (index, name)
             self.app.notification_presenter.log_debug(f"Switched to tab: {name}", "TabManager")
 
     # Workspace Persistence
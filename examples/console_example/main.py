@@ -12,9 +12,12 @@ Licensed under MIT License
 """
 
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
 import sys
 import time
-import threading
+from collections import deque
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
 # Add both src and project root to Python path
@@ -62,8 +65,14 @@ class ConsoleExampleApp(BaseApplication):
     def __init__(self, config: ConsoleExampleConfiguration):
         super().__init__(config)
         self.console_presenter = None
-        self.demo_thread = None
-        self.demo_running = False
+
+        # (text, output_type) written by the demo, flushed to the console in
+        # one write per stream 50 ms after the first entry is buffered
+        self._out_buffer = deque()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_console)
 
         # Initialize features after the application is set up
         self._setup_console()
@@ -98,62 +107,68 @@ class ConsoleExampleApp(BaseApplication):
         print("You can extend this example to add more features as needed")
 
     def _start_console_demo(self):
-        """Start a background thread that generates sample output."""
-        self.demo_running = True
-        self.demo_thread = threading.Thread(
-            target=self._console_demo_worker, daemon=True)
-        self.demo_thread.start()
-
-    def _console_demo_worker(self):
-        """Worker thread that generates sample console output."""
-        counter = 0
-
-        while self.demo_running:
-            try:
-                time.sleep(3)  # Wait 3 seconds between outputs
-
-                counter += 1
-
-                if counter % 3 == 1:
-                    # Normal stdout output
-                    print(
-                        f"[Demo] Regular output #{counter} - Everything is working normally")
-
-                elif counter % 3 == 2:
-                    # Error output to stderr
-                    print(
-                        f"[Demo] Simulated error #{counter} - This is an example error", file=sys.stderr)
-
-                else:
-                    # Programmatic output through console presenter
-                    if self.console_presenter:
-                        self.console_presenter.write_to_console(
-                            f"[Demo] Programmatic output #{counter} - Written directly to console\n",
-                            'stdout'
-                        )
-
-                # Occasionally generate multi-line output
-                if counter % 5 == 0:
-                    print("Multi-line output example:")
-                    print("  Line 1: This demonstrates")
-                    print("  Line 2: how multi-line output")
-                    print("  Line 3: appears in the console")
-
-                # Stop after 50 iterations to avoid endless spam
-                if counter >= 50:
-                    print("[Demo] Console demo completed - no more automatic output")
-                    break
-
-            except Exception as e:
-                print(f"Demo worker error: {e}")
-                break
+        """Start a timer that generates sample output every 3 seconds."""
+        self._demo_counter = 0
+        self._demo_timer = QTimer(self)
+        self._demo_timer.timeout.connect(self._demo_tick)
+        self._demo_timer.start(3000)
+
+    def _demo_tick(self):
+        """Generate one round of sample console output."""
+        self._demo_counter += 1
+        counter = self._demo_counter
+        write = self._buffer_output
+
+        if counter % 3 == 1:
+            # Normal stdout output
+            write((f"[Demo] Regular output #{counter} - Everything is working normally\n",
+                   'stdout'))
+
+        elif counter % 3 == 2:
+            # Error output to stderr
+            write((f"[Demo] Simulated error #{counter} - This is an example error\n",
+                   'stderr'))
+
+        else:
+            # Programmatic output through console presenter
+            write((f"[Demo] Programmatic output #{counter} - Written directly to console\n",
+                   'stdout'))
+
+        # Occasionally generate multi-line output
+        if counter % 5 == 0:
+            write(("Multi-line output example:\n"
+                   "  Line 1: This demonstrates\n"
+                   "  Line 2: how multi-line output\n"
+                   "  Line 3: appears in the console\n", 'stdout'))
+
+        # Stop after 50 iterations to avoid endless spam
+        if counter >= 50:
+            write(("[Demo] Console demo completed - no more automatic output\n",
+                   'stdout'))
+            self._demo_timer.stop()
+
+    def _buffer_output(self, entry):
+        """Queue a (text, output_type) entry and schedule a flush if none is pending."""
+        self._out_buffer.append(entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_console(self):
+        """Write buffered demo output to the console, one write per stream run."""
+        if not self._out_buffer or not self.console_presenter:
+            return
+        pending = []
+        while self._out_buffer:
+            pending.append(self._out_buffer.popleft())
+        for output_type, chunks in groupby(pending, key=itemgetter(1)):
+            self.console_presenter.write_to_console(
+                "".join(text for text, _ in chunks), output_type)
 
     def closeEvent(self, event):
         """Handle application close event."""
-        # Stop the demo thread
-        self.demo_running = False
-        if self.demo_thread and self.demo_thread.is_alive():
-            self.demo_thread.join(timeout=1.0)
+        # Stop the demo output
+        self._demo_timer.stop()
+        self._flush_timer.stop()
 
         # Clean up console
         if self.console_presenter:
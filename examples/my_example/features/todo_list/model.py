@@ -30,21 +30,23 @@ class TodoListModel(BaseModel):
 
     def __init__(self, app: BaseApplication) -> None:
         super().__init__(app)
-
+        # Own list, so in-place edits never touch the shared field default
+        self._todo_list: List[str] = []
 
     def add_todo_list(self, value: str):
-        # Create a new list with the added item
-        current_list = list(self.todo_list) if self.todo_list else []
-        current_list.append(value)
-        # Assign to trigger automatic field notification
-        self.todo_list = current_list
+        # Edit in place and notify only the added (row, value)
+        self.todo_list.append(value)
+        self.notify("todo_list_item_added", (len(self.todo_list) - 1, value))
+        self.mark_dirty()
 
     def remove_todo_list(self, value: str):
-        current_list = list(self.todo_list) if self.todo_list else []
-        if value in current_list:
-            current_list.remove(value)
-            # Assign to trigger automatic field notification
-            self.todo_list = current_list
+        try:
+            row = self.todo_list.index(value)
+        except ValueError:
+            return
+        del self.todo_list[row]
+        self.notify("todo_list_item_removed", (row, value))
+        self.mark_dirty()
 
     def feature_name(self) -> str:
         """Must be overridden in subclasses"""
@@ -32,7 +32,12 @@ class TodoListPresenter(BasePresenter):
 
     def update(self, field_name: str, new_value: Any, old_value: Any = None, model: Any = None) -> None:
         """Handle model field change notifications"""
-        if field_name == "todo_list":
+        if field_name == "todo_list_item_added":
+            self._view.append_row(new_value[1])
+        elif field_name == "todo_list_item_removed":
+            self._view.remove_row(new_value[0])
+        elif field_name == "todo_list":
+            # Full refresh, e.g. when a workspace is restored
             self._view.update_todo_list(new_value)
 
     def _add_to_list(self, value: str):
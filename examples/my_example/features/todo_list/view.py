@@ -10,7 +10,7 @@
 """
 from typing import List
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, Slot
 from PySide6.QtGui import QStandardItemModel, QStandardItem 
 from PySide6.QtWidgets import QLineEdit, QWidget, QPushButton, QTableView, QVBoxLayout, QFrame
 
@@ -43,11 +43,34 @@ class TodoListView(BaseView):
         frame.setLayout(vertical_layout)
         self.setWidget(frame)
 
+    @Slot()
     def _on_button_click(self):
         self.item_added.emit(self.item_edit.text())
 
 
+    def append_row(self, value: str):
+        """Append a single item to the table."""
+        self.todo_model.appendRow(QStandardItem(str(value)))
+
+    def remove_row(self, row: int):
+        """Remove the item at the given row from the table."""
+        self.todo_model.removeRow(row)
+
     def update_todo_list(self, todo_list_model):
-        self.todo_model.clear()
-        for item in todo_list_model:
-            self.todo_model.appendRow(QStandardItem(str(item)))
+        """Bring the table in line with the list, touching only changed rows."""
+        model = self.todo_model
+        new_count = len(todo_list_model)
+        old_count = model.rowCount()
+        self.todo_view.setUpdatesEnabled(False)
+        try:
+            for row in range(min(new_count, old_count)):
+                text = str(todo_list_model[row])
+                existing = model.item(row)
+                if existing.text() != text:
+                    existing.setText(text)
+            if new_count < old_count:
+                model.removeRows(new_count, old_count - new_count)
+            for row in range(old_count, new_count):
+                model.appendRow(QStandardItem(str(todo_list_model[row])))
+        finally:
+            self.todo_view.setUpdatesEnabled(True)
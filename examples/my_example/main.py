@@ -4,14 +4,12 @@ This example demonstrates the new MVP (Model-View-Presenter) pattern
 along with the annotation system for settings and workspace persistence.
 It also shows how to configure custom paths for settings and workspace files.
 """
+import functools
 import sys
-from pathlib import Path
 
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
-from PySide6.QtWidgets import QApplication, QMessageBox
+from PySide6.QtWidgets import QApplication
 
-from opaque.models.annotations import StringField, IntField
 from opaque.view.application import BaseApplication
 from opaque.models.configuration import DefaultApplicationConfiguration
 
@@ -30,9 +28,14 @@ class MyApplicationConfiguration(DefaultApplicationConfiguration):
     def get_application_description(self) -> str:
         return "My Example Application Description"
 
-    def get_application_icon(self) -> QIcon:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _icon() -> QIcon:
         return QIcon.fromTheme(QIcon.ThemeIcon.AddressBookNew)
 
+    def get_application_icon(self) -> QIcon:
+        return self._icon()
+
     def get_application_organization(self) -> str:
         return "My Company"
 
@@ -33,10 +33,10 @@ class ModelMeta(ABCMeta):
 
                 private_name = f'_{attr_name}'
 
-                def getter(self, name=attr_name, default=attr_value.default):
-                    return getattr(self, f'_{name}', default)
+                def getter(self, private=private_name, default=attr_value.default):
+                    return getattr(self, private, default)
 
-                def setter(self, value, name=attr_name, field=attr_value):
+                def setter(self, value, name=attr_name, field=attr_value, private=private_name):
                     # --- Validation ---
                     if field.choices is not None and value not in field.choices:
                         raise ValueError(
@@ -49,9 +49,9 @@ class ModelMeta(ABCMeta):
                             f"Value '{value}' for '{name}' is greater than the maximum allowed value: {field.max_value}")
                     # ------------------
 
-                    old_value = getattr(self, f'_{name}', None)
+                    old_value = getattr(self, private, None)
                     if old_value != value:
-                        setattr(self, f'_{name}', value)
+                        setattr(self, private, value)
                         # All Field attributes are automatically observable
                         field.notify(self, old_value, value)
                         self.mark_dirty()
@@ -12,15 +12,74 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
 from opaque.services.service import BaseService
 from opaque.presenters.presenter import BasePresenter
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the standard library
+    orjson = None
+
+
+def _encode_workspace(workspace_data: Dict[str, Any]) -> bytes:
+    """Serialize workspace data to the bytes written to the workspace file."""
+    if orjson is not None:
+        return orjson.dumps(workspace_data, option=orjson.OPT_INDENT_2)
+    return json.dumps(workspace_data, indent=2).encode('utf-8')
+
+
+def _write_workspace(workspace_file: str, payload: bytes) -> str:
+    """Write serialized workspace data to file and return the file name."""
+    Path(workspace_file).write_bytes(payload)
+    return Path(workspace_file).name
+
+
+def _read_workspace(workspace_file: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Read workspace data from file, None if the file does not exist."""
+    path = Path(workspace_file)
+    if not path.exists():
+        return path.name, None
+    if orjson is not None:
+        return path.name, orjson.loads(path.read_bytes())
+    with open(workspace_file, 'r', encoding='utf-8') as f:
+        return path.name, json.load(f)
+
+
+class _FileTaskSignals(QObject):
+    """Signals of a _FileTask, a QRunnable cannot emit signals itself."""
+    finished = Signal(object, object)  # result, exception or None
+
+
+class _FileTask(QRunnable):
+    """Runs a workspace file read or write on a thread pool worker."""
+
+    def __init__(self, function: Callable[..., Any], *args: Any):
+        super().__init__()
+        self.signals = _FileTaskSignals()
+        self._function = function
+        self._args = args
+
+    def run(self) -> None:
+        try:
+            result = self._function(*self._args)
+        except Exception as e:
+            self.signals.finished.emit(None, e)
+        else:
+            self.signals.finished.emit(result, None)
+
 
 class WorkspaceService(BaseService):
     """Manages workspace state persistence."""
 
+    # Emitted on the GUI thread when an async save/load ends
+    # with the workspace file name (or None) and the error (or None)
+    workspace_saved = Signal(object, object)
+    workspace_loaded = Signal(object, object)
+
     def __init__(self):
         """
         Initialize the workspace manager.
@@ -33,6 +92,9 @@ class WorkspaceService(BaseService):
         # Store feature models for annotation support
         self._features: Dict[str, BasePresenter] = {}
 
+        # Signal holders of running file tasks, kept alive until they report
+        self._tasks: Set[_FileTaskSignals] = set()
+
     def register_feature(self, presenter: BasePresenter) -> None:
         """
         Register a feature model for annotation-based workspace collection.
@@ -57,30 +119,85 @@ class WorkspaceService(BaseService):
             return self._features.pop(feature_id)
         return None
 
-    def save_workspace(self, workspace_file: str) -> Optional[str]:
-        """Save workspace to file."""
-        workspace_data = {}
-        # Collect current values from registered models
+    def _collect_workspace(self) -> Dict[str, Any]:
+        """Collect current values from registered models."""
+        workspace_data: Dict[str, Any] = {}
         for _, presenter in self._features.items():
             presenter.save_workspace(workspace_data)
+        return workspace_data
 
+    def _apply_workspace(self, workspace_data: Optional[Dict[str, Any]]) -> bool:
+        """Hand loaded workspace data to the registered presenters."""
+        if not workspace_data:
+            return False
+        for _, presenter in self._features.items():
+            presenter.load_workspace(workspace_data)
+        return True
+
+    def save_workspace(self, workspace_file: str) -> Optional[str]:
+        """Save workspace to file."""
+        workspace_data = self._collect_workspace()
         if workspace_data:
-            with open(workspace_file, 'w', encoding='utf-8') as f:
-                json.dump(workspace_data, f, indent=2)
-            return Path(workspace_file).name
+            return _write_workspace(workspace_file, _encode_workspace(workspace_data))
         return None
 
     def load_workspace(self, workspace_file: str) -> Optional[str]:
         """Load workspace from file."""
-        if Path(workspace_file).exists():
-            with open(workspace_file, 'r', encoding='utf-8') as f:
-                workspace_data = json.load(f)
-            if workspace_data:
-                for _, presenter in self._features.items():
-                    presenter.load_workspace(workspace_data)
-                return Path(workspace_file).name
+        name, workspace_data = _read_workspace(workspace_file)
+        if self._apply_workspace(workspace_data):
+            return name
         return None
 
+    def save_workspace_async(self, workspace_file: str) -> None:
+        """
+        Save workspace to file, writing it on a worker thread.
+
+        The workspace is collected and serialized on the calling (GUI) thread,
+        since it holds live model containers; only the bytes go to the worker.
+        The result is reported through the workspace_saved signal.
+        """
+        workspace_data = self._collect_workspace()
+        if not workspace_data:
+            self.workspace_saved.emit(None, None)
+            return
+        self._start_task(self._on_saved, _write_workspace,
+                         workspace_file, _encode_workspace(workspace_data))
+
+    def load_workspace_async(self, workspace_file: str) -> None:
+        """
+        Load workspace from file, reading it on a worker thread.
+
+        The data is handed to the presenters on the GUI thread, the result is
+        reported through the workspace_loaded signal.
+        """
+        self._start_task(self._on_loaded, _read_workspace, workspace_file)
+
+    def _start_task(self, slot: Callable[[Any, Any], None],
+                    function: Callable[..., Any], *args: Any) -> None:
+        task = _FileTask(function, *args)
+        self._tasks.add(task.signals)
+        # Bound to a service method so the result is queued to the GUI thread
+        task.signals.finished.connect(slot)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_saved(self, name: Optional[str], error: Optional[Exception]) -> None:
+        self._tasks.discard(self.sender())
+        self.workspace_saved.emit(name, error)
+
+    def _on_loaded(self, result: Optional[Tuple[str, Any]],
+                   error: Optional[Exception]) -> None:
+        self._tasks.discard(self.sender())
+        if error is not None:
+            self.workspace_loaded.emit(None, error)
+            return
+        name, workspace_data = result
+        try:
+            loaded = self._apply_workspace(workspace_data)
+        except Exception as e:
+            self.workspace_loaded.emit(None, e)
+            return
+        self.workspace_loaded.emit(name if loaded else None, None)
+
     def initialize(self) -> None:
         super().initialize()
         self._features.clear()
@@ -101,6 +101,8 @@ class BaseApplication(QMainWindow):
         self.workspace_service = WorkspaceService()
         self.workspace_service.initialize()
         ServiceLocator.register_service(self.workspace_service)
+        self.workspace_service.workspace_saved.connect(self._on_workspace_saved)
+        self.workspace_service.workspace_loaded.connect(self._on_workspace_loaded)
 
         # Initialize theme service
         self.theme_service = ThemeService(app)
@@ -215,8 +217,7 @@ class BaseApplication(QMainWindow):
                     f"{description} (*{extension})")
             )
             if file_path:
-                name = self.workspace_service.save_workspace(file_path)
-                self.update_application_title(name)
+                self.workspace_service.save_workspace_async(file_path)
         except Exception as e:
             print(e)
             QMessageBox.critical(self, self.tr("Error Saving Workspace"), self.tr(
@@ -232,13 +233,28 @@ class BaseApplication(QMainWindow):
                     f"{description} (*{extension})")
             )
             if file_path:
-                name = self.workspace_service.load_workspace(file_path)
-                self.update_application_title(name)
+                self.workspace_service.load_workspace_async(file_path)
         except Exception as e:
             print(e)
             QMessageBox.critical(self, self.tr("Error Loading Workspace"), self.tr(
                 f"An error happened while loading workspace file. Details {e}"))
 
+    def _on_workspace_saved(self, name: Optional[str], error: Optional[Exception]) -> None:
+        if error is not None:
+            print(error)
+            QMessageBox.critical(self, self.tr("Error Saving Workspace"), self.tr(
+                f"An error happened while saving workspace file. Details {error}"))
+            return
+        self.update_application_title(name)
+
+    def _on_workspace_loaded(self, name: Optional[str], error: Optional[Exception]) -> None:
+        if error is not None:
+            print(error)
+            QMessageBox.critical(self, self.tr("Error Loading Workspace"), self.tr(
+                f"An error happened while loading workspace file. Details {error}"))
+            return
+        self.update_application_title(name)
+
     def show_settings_dialog(self) -> None:
         """
         Gathers all features with settings and displays the settings dialog.
@@ -308,9 +324,7 @@ class BaseApplication(QMainWindow):
                     file_path = urls[0].toLocalFile()
                     if file_path.lower().endswith('.lab'):
                         if self.workspace_service:
-                            name = self.workspace_service.load_workspace(
-                                file_path)
-                            self.update_application_title(name)
+                            self.workspace_service.load_workspace_async(file_path)
                         event.acceptProposedAction()
                         return
         except Exception as e:
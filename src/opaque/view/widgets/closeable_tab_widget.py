@@ -11,10 +11,61 @@
 
 from typing import Optional, Dict, Any, Callable, Type
 from PySide6.QtWidgets import (
-    QWidget, QTabWidget, QVBoxLayout,
+    QWidget, QTabWidget, QVBoxLayout, QStackedLayout,
     QInputDialog, QMessageBox, QLabel, QTabBar
 )
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Signal, QTimer
+
+
+class _LazyTab(QWidget):
+    """
+    Placeholder for a restored tab that builds its real widget the first
+    time the tab is shown, then replays the saved workspace data into it.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], QWidget],
+        widget_type: Optional[str] = None,
+        pending_data: Any = None,
+        parent: Optional[QWidget] = None
+    ):
+        super().__init__(parent=parent)
+        self._factory = factory
+        self._content: Optional[QWidget] = None
+        self.widget_type = widget_type
+        self.pending_data = pending_data
+        QStackedLayout(self)
+
+    def is_pending(self) -> bool:
+        """Whether the real widget has not been built yet."""
+        return self._content is None and self.pending_data is not None
+
+    def content(self) -> QWidget:
+        """Return the real widget, building it on first use."""
+        if self._content is None:
+            self._content = self._factory()
+            if self.pending_data is not None and hasattr(self._content, 'load_workspace_data'):
+                try:
+                    load_method = getattr(self._content, 'load_workspace_data')
+                    if callable(load_method):
+                        load_method(self.pending_data)
+                except Exception as e:
+                    print(f"Error loading workspace data to widget: {e}")
+            self.pending_data = None
+            self.layout().addWidget(self._content)
+        return self._content
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Restoring a workspace makes each new tab current in turn; build on
+        # the next event loop pass so only the tab still shown gets built
+        if self._content is None:
+            QTimer.singleShot(0, self._build_if_visible)
+
+    def _build_if_visible(self):
+        if self.isVisible():
+            self.content()
 
 
 class CloseableTabWidget(QWidget):
@@ -46,6 +97,7 @@ class CloseableTabWidget(QWidget):
         default_tab_name: str = "Tab",
         minimum_tabs: int = 1,
         show_plus_tab: bool = True,
+        lazy_tabs: bool = False,
         parent: Optional[QWidget] = None
     ):
         """
@@ -57,6 +109,8 @@ class CloseableTabWidget(QWidget):
             default_tab_name: Default name for new tabs
             minimum_tabs: Minimum number of tabs that must remain open
             show_plus_tab: Whether to show the "+" tab for adding new tabs
+            lazy_tabs: Whether tabs restored from a workspace build their
+                widget only when first shown
             parent: Parent widget
         """
         super().__init__(parent=parent)
@@ -66,6 +120,7 @@ class CloseableTabWidget(QWidget):
         self._default_tab_name = default_tab_name
         self._minimum_tabs = max(1, minimum_tabs)
         self._show_plus_tab = show_plus_tab
+        self._lazy_tabs = lazy_tabs
         self._tab_counter = 0
         self._current_widget = None
         self._removing_tab = False  # Flag to prevent dialog during tab removal
@@ -392,6 +447,8 @@ class CloseableTabWidget(QWidget):
             isinstance(self._current_widget.parent(), QWidget) and
                 self.tab_widget.tabText(self.tab_widget.currentIndex()) == "+"):
             return None
+        if isinstance(self._current_widget, _LazyTab):
+            return self._current_widget.content()
         return self._current_widget
 
     def get_widget_at_index(self, index: int) -> Optional[QWidget]:
@@ -401,6 +458,8 @@ class CloseableTabWidget(QWidget):
             # Don't return plus tab widget
             if self._show_plus_tab and self.tab_widget.tabText(index) == "+":
                 return None
+            if isinstance(widget, _LazyTab):
+                return widget.content()
             return widget
         return None
 
@@ -443,6 +502,17 @@ class CloseableTabWidget(QWidget):
                 continue
 
             widget = self.tab_widget.widget(i)
+            if isinstance(widget, _LazyTab):
+                # Never shown since it was restored: save the data it was given
+                if widget.is_pending():
+                    tabs_data.append({
+                        'name': tab_name,
+                        'widget_type': widget.widget_type,
+                        'widget_data': widget.pending_data
+                    })
+                    continue
+                widget = widget.content()
+
             tab_data: Dict[str, Any] = {
                 'name': tab_name,
                 'widget_type': widget.__class__.__name__ if widget else None
@@ -470,16 +540,26 @@ class CloseableTabWidget(QWidget):
         if not data or 'tabs' not in data:
             return False
 
+        # Hide the tab bar while restoring so its tab layout is recomputed
+        # once at the end rather than for every tab added
+        bar = self.tab_widget.tabBar()
+        was_visible = bar.isVisible()
+        bar.setUpdatesEnabled(False)
+        bar.setVisible(False)
+        # The plus tab becomes current as the other tabs go; don't open the
+        # add tab dialog for that
+        self._removing_tab = True
+
         try:
-            # Clear existing tabs except plus tab
-            while self._get_real_tab_count() > 0:
-                for i in range(self.tab_widget.count()):
-                    if not (self._show_plus_tab and self.tab_widget.tabText(i) == "+"):
-                        widget = self.tab_widget.widget(i)
-                        if widget:
-                            widget.deleteLater()
-                        self.tab_widget.removeTab(i)
-                        break
+            # Clear existing tabs except plus tab, back to front so each
+            # removal does not shift the tabs still to be removed
+            for i in range(self.tab_widget.count() - 1, -1, -1):
+                if self._show_plus_tab and self.tab_widget.tabText(i) == "+":
+                    continue
+                widget = self.tab_widget.widget(i)
+                if widget:
+                    widget.deleteLater()
+                self.tab_widget.removeTab(i)
 
             # Restore tab counter
             if 'tab_counter' in data:
@@ -490,6 +570,15 @@ class CloseableTabWidget(QWidget):
                 tab_name = tab_data.get(
                     'name', f"{self._default_tab_name} {self._tab_counter + 1}")
 
+                if self._lazy_tabs:
+                    # Build the widget and load its data on first show
+                    widget = _LazyTab(
+                        self._create_widget,
+                        tab_data.get('widget_type'),
+                        tab_data.get('widget_data'))
+                    self.add_tab(tab_name, widget)
+                    continue
+
                 # Create widget
                 widget = self._create_widget()
 
@@ -519,3 +608,8 @@ class CloseableTabWidget(QWidget):
             while self._get_real_tab_count() < self._minimum_tabs:
                 self.add_tab()
             return False
+
+        finally:
+            self._removing_tab = False
+            bar.setVisible(was_visible)
+            bar.setUpdatesEnabled(True)
@@ -90,7 +90,7 @@ class ConsoleWidget(QWidget):
         # Clear button
         clear_action = QAction(QIcon.fromTheme("edit-clear"), "Clear", self)
         clear_action.setToolTip("Clear console output")
-        clear_action.triggered.connect(self.clear_requested.emit)
+        clear_action.triggered.connect(self.clear_requested)
         toolbar.addAction(clear_action)
 
         toolbar.addSeparator()
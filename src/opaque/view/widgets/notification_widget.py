@@ -16,7 +16,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QFrame, QScrollArea, QApplication, QGraphicsOpacityEffect
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QPropertyAnimation, QPoint, QSize, QRect
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QPropertyAnimation, QPoint, QSize, QRect
 from PySide6.QtGui import QIcon, QFont, QColor, QPainter, QBrush, QPen
 
 from opaque.services.service import ServiceLocator
@@ -166,7 +166,7 @@ class NotificationListItem(QFrame):
         close_btn.setFixedSize(16, 16)
         close_btn.setFlat(True)
         close_btn.setStyleSheet("QPushButton { border: none; font-weight: bold; color: gray; } QPushButton:hover { color: red; }")
-        close_btn.clicked.connect(lambda: self.removed.emit(self.notification.id))
+        close_btn.clicked.connect(self._on_close_clicked)
         header.addWidget(close_btn)
         
         layout.addLayout(header)
@@ -189,6 +189,10 @@ class NotificationListItem(QFrame):
             }
         """)
 
+    @Slot()
+    def _on_close_clicked(self):
+        self.removed.emit(self.notification.id)
+
     def _get_color(self):
         level = self.notification.level
         if level in (NotificationLevel.ERROR, NotificationLevel.CRITICAL): return "#dc3545"
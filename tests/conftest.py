@@ -0,0 +1,33 @@
+"""
+Shared pytest fixtures.
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+BASIC_EXAMPLE_DIR = Path(__file__).resolve().parents[1] / "examples" / "basic_example"
+
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture
+def basic_example(monkeypatch):
+    """Make the basic example's ``features``/``services`` packages importable for one test."""
+    monkeypatch.syspath_prepend(str(BASIC_EXAMPLE_DIR))
+    yield BASIC_EXAMPLE_DIR
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("features", "services"):
+            del sys.modules[name]
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """A QApplication shared by every test that needs widgets."""
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
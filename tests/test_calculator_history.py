@@ -0,0 +1,61 @@
+"""
+Calculator presenter to calculation service history round trip.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def calculation_service(basic_example):
+    from services.calculation_service import CalculationService
+
+    service = CalculationService()
+    service.initialize()
+    return service
+
+
+def test_add_to_history_renders_op_codes(calculation_service):
+    calculation_service._add_to_history("Operation", "+")
+    calculation_service._add_to_history("Result", "5")
+
+    assert calculation_service.get_history() == ("Operation: +", "Result: 5")
+
+
+def test_history_mixes_raw_and_computed_entries(calculation_service):
+    calculation_service.add(2, 3)
+    calculation_service._add_to_history("Result", 5)
+
+    assert calculation_service.get_history() == ("2 + 3 = 5", "Result: 5")
+
+
+def test_get_history_reflects_new_entries(calculation_service):
+    calculation_service._add_to_history("Result", 1)
+    first = calculation_service.get_history()
+    calculation_service._add_to_history("Result", 2)
+
+    assert first == ("Result: 1",)
+    assert calculation_service.get_history() == ("Result: 1", "Result: 2")
+
+
+def test_presenter_records_operation_and_result(qapp, calculation_service, monkeypatch):
+    from opaque.services.service import ServiceLocator
+    from features.calculator.model import CalculatorModel
+    from features.calculator.view import CalculatorView
+    from features.calculator.presenter import CalculatorPresenter
+
+    # The presenter looks the service up by its short name
+    monkeypatch.setitem(ServiceLocator._services, "calculation", calculation_service)
+
+    view = CalculatorView(None)
+    presenter = CalculatorPresenter(CalculatorModel(None), view, None)
+
+    view.digit_clicked.emit("2")
+    view.operation_clicked.emit("*")
+    view.digit_clicked.emit("4")
+    view.equals_clicked.emit()
+
+    result = presenter.model.current_value
+    assert float(result) == 8
+    assert calculation_service.get_history() == ("Operation: *", f"Result: {result}")
+    view.deleteLater()
@@ -0,0 +1,32 @@
+"""
+Calculator model result formatting.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def model(basic_example):
+    from features.calculator.model import CalculatorModel
+
+    return CalculatorModel(None)
+
+
+def _compute(model, a, operation, b):
+    model.current_value = a
+    model.set_operation(operation)
+    model.current_value = b
+    model.execute_operation()
+    return model.current_value
+
+
+def test_result_keeps_plain_float_formatting(model):
+    assert _compute(model, "2", "*", "4") == "8.0"
+    assert _compute(model, "1", "/", "3") == str(round(1 / 3, model.decimal_places))
+
+
+def test_large_result_uses_scientific_notation(model):
+    model.scientific_notation = True
+
+    assert _compute(model, "2000", "*", "1000") == f"{2e6:.{model.decimal_places}e}"
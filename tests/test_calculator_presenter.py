@@ -0,0 +1,37 @@
+"""
+Calculator presenter history refreshes.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def presenter(qapp, basic_example):
+    from features.calculator.model import CalculatorModel
+    from features.calculator.view import CalculatorView
+    from features.calculator.presenter import CalculatorPresenter
+
+    view = CalculatorView(None)
+    yield CalculatorPresenter(CalculatorModel(None), view, None)
+    view.deleteLater()
+
+
+def test_history_is_redrawn_only_when_replaced(qapp, presenter, monkeypatch):
+    redraws = []
+    monkeypatch.setattr(presenter.view, "update_history", redraws.append)
+    view = presenter.view
+
+    view.digit_clicked.emit("2")
+    view.operation_clicked.emit("+")
+    view.digit_clicked.emit("3")
+    view.equals_clicked.emit()
+    qapp.processEvents()
+
+    assert redraws == []
+    assert view.history_display.toPlainText().endswith("2.0 + 3.0 = 5.0")
+
+    view.clear_history_clicked.emit()
+    qapp.processEvents()
+
+    assert redraws == [[]]
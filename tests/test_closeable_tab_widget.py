@@ -0,0 +1,30 @@
+"""
+CloseableTabWidget workspace restore.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def tab_widget(qapp):
+    from PySide6.QtWidgets import QWidget
+    from opaque.view.widgets.closeable_tab_widget import CloseableTabWidget
+
+    widget = CloseableTabWidget(widget_factory=QWidget, show_plus_tab=True)
+    yield widget
+    widget.deleteLater()
+
+
+def test_load_workspace_data_does_not_open_add_tab_dialog(tab_widget, monkeypatch):
+    calls = []
+    monkeypatch.setattr(tab_widget, "_show_add_tab_dialog", lambda: calls.append(True))
+    for _ in range(3):
+        tab_widget.add_tab()
+
+    data = {"tabs": [{"name": "Restored 1"}, {"name": "Restored 2"}], "current_tab": 0}
+    assert tab_widget.load_workspace_data(data)
+
+    assert calls == []
+    names = [tab_widget.tab_widget.tabText(i) for i in range(tab_widget.tab_widget.count())]
+    assert names == ["Restored 1", "Restored 2", "+"]
@@ -0,0 +1,58 @@
+"""
+Example DataService store and values cache.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def data_service(basic_example):
+    from services.data_service import DataService
+
+    service = DataService()
+    service.initialize()
+    return service
+
+
+def test_add_and_remove(data_service):
+    data_service.add_data("a", 1)
+    data_service.add_data("b", 2)
+
+    assert data_service.get_all_data() == (1, 2)
+    assert data_service.remove_data("a")
+    assert not data_service.remove_data("a")
+    assert data_service.get_all_data() == (2,)
+    assert not data_service.data_exists("a")
+
+
+def test_values_cache_is_shared_until_the_store_changes(data_service):
+    data_service.add_data("a", 1)
+    first = data_service.get_all_data()
+
+    assert data_service.get_all_data() is first
+
+    data_service.add_data("b", 2)
+    assert data_service.get_all_data() == (1, 2)
+
+    data_service.bulk_add({"c": 3})
+    assert data_service.get_all_data() == (1, 2, 3)
+
+    data_service.clear_data()
+    assert data_service.get_all_data() == ()
+
+
+def test_remove_data_accepts_stored_none(data_service):
+    data_service.add_data("empty", None)
+
+    assert data_service.remove_data("empty")
+    assert not data_service.remove_data("empty")
+    assert data_service.get_data_count() == 0
+
+
+def test_cleanup_keeps_the_service_initialized(data_service):
+    data_service.add_data("a", 1)
+    data_service.cleanup()
+
+    assert data_service.is_initialized
+    assert data_service.get_all_data() == (1,)
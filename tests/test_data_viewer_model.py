@@ -0,0 +1,56 @@
+"""
+Data viewer model filter text and statistics.
+"""
+import importlib.util
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def model(basic_example):
+    from features.data_viewer.model import DataViewerModel
+
+    return DataViewerModel(None)
+
+
+@pytest.mark.parametrize("first, second", [
+    ({"active": True}, {"active": 1}),
+    ({"value": 1}, {"value": 1.0}),
+    ({"a": 1, "b": 2}, {"b": 2, "a": 1}),
+])
+def test_filter_text_follows_each_filter(model, first, second):
+    from features.data_viewer._json import dumps
+
+    model.apply_filter(first)
+    model.apply_filter(second)
+
+    assert model.last_filter == dumps(second).decode("utf-8")
+
+
+@pytest.mark.parametrize("orjson_available", [True, False])
+def test_json_backends_produce_the_same_text(basic_example, monkeypatch, orjson_available):
+    if orjson_available:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    path = basic_example / "features" / "data_viewer" / "_json.py"
+    spec = importlib.util.spec_from_file_location("_json_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.dumps({"a": [1, "é"]}) == '{"a":[1,"é"]}'.encode("utf-8")
+    assert module.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+
+def test_get_statistics_returns_a_copy_of_the_cache(model):
+    model.generate_sample_data()
+    stats = model.get_statistics()
+    stats['total_items'] = -1
+    stats['categories']['A'] = -1
+
+    fresh = model.get_statistics()
+    assert fresh['total_items'] == 10
+    assert fresh['categories'] == {'A': 4, 'B': 3, 'C': 3}
@@ -0,0 +1,40 @@
+"""
+Example LoggingService message formatting.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+
+@pytest.fixture
+def logging_service(basic_example):
+    from services.logging_service import LoggingService
+
+    service = LoggingService()
+    service.initialize()
+    service.clear_logs()
+    return service
+
+
+def test_log_formats_args_into_the_message(logging_service):
+    logging_service.log("debug", "Digit clicked: %s", "7")
+    logging_service.log("info", "100% done")
+
+    messages = [entry["message"] for entry in logging_service.get_logs()]
+    assert messages == ["Digit clicked: 7", "100% done"]
+
+
+def test_presenter_passes_args_to_the_service(qapp, logging_service, monkeypatch):
+    from opaque.services.service import ServiceLocator
+    from features.calculator.model import CalculatorModel
+    from features.calculator.view import CalculatorView
+    from features.calculator.presenter import CalculatorPresenter
+
+    monkeypatch.setitem(ServiceLocator._services, "logging", logging_service)
+    view = CalculatorView(None)
+    CalculatorPresenter(CalculatorModel(None), view, None)
+
+    view.digit_clicked.emit("7")
+
+    assert logging_service.get_logs("debug")[-1]["message"] == "[Calculator] Digit clicked: 7"
+    view.deleteLater()